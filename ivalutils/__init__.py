@@ -21,23 +21,71 @@
 
 # standard library imports
 from __future__ import absolute_import
+from collections import namedtuple
+from importlib import import_module
 
-# local imports
-from .interval import (
-    Limit, LowerLimit, LowerInfiniteLimit, UpperLimit, UpperInfiniteLimit,
-    LowerClosedLimit, LowerOpenLimit, UpperClosedLimit, UpperOpenLimit,
-    Interval, InvalidInterval, ChainableInterval, ClosedInterval,
-    LowerClosedInterval, LowerOpenInterval, OpenBoundedInterval,
-    OpenFiniteInterval, UpperClosedInterval, UpperOpenInterval,
-)
-from .interval_chain import IntervalChain
-from .interval_map import IntervalMapping
+
+# public names and the submodules defining them; the submodules are only
+# imported when one of their names is accessed for the first time
+_LAZY = {
+    'Limit': 'interval',
+    'LowerLimit': 'interval',
+    'LowerInfiniteLimit': 'interval',
+    'UpperLimit': 'interval',
+    'UpperInfiniteLimit': 'interval',
+    'LowerClosedLimit': 'interval',
+    'LowerOpenLimit': 'interval',
+    'UpperClosedLimit': 'interval',
+    'UpperOpenLimit': 'interval',
+    'Interval': 'interval',
+    'InvalidInterval': 'interval',
+    'ChainableInterval': 'interval',
+    'ClosedInterval': 'interval',
+    'LowerClosedInterval': 'interval',
+    'LowerOpenInterval': 'interval',
+    'OpenBoundedInterval': 'interval',
+    'OpenFiniteInterval': 'interval',
+    'UpperClosedInterval': 'interval',
+    'UpperOpenInterval': 'interval',
+    'IntervalChain': 'interval_chain',
+    'IntervalMapping': 'interval_map',
+}
+
+# the submodules themselves are also imported lazily
+_SUBMODULES = frozenset(_LAZY.values())
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        # importing a submodule binds it in the module namespace
+        return import_module('.' + name, __name__)
+    try:
+        mod_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r"
+                             % (__name__, name))
+    mod = import_module('.' + mod_name, __name__)
+    # bind all names provided by the submodule in the module namespace at
+    # once, so __getattr__ is bypassed for them from now on (for example
+    # when 'from ivalutils import *' walks __all__)
+    namespace = globals()
+    for lazy_name, lazy_mod_name in _LAZY.items():
+        if lazy_mod_name == mod_name:
+            namespace[lazy_name] = getattr(mod, lazy_name)
+    return namespace[name]
 
 
-__version__ = 0, 8, 1
+def __dir__():
+    return sorted(set(globals()).union(__all__, _SUBMODULES))
 
 
-__all__ = [
+_Version = namedtuple('Version', ['major', 'minor', 'patch'])
+
+__version__ = _Version(0, 8, 1)
+__version_string__ = '%d.%d.%d' % __version__
+
+
+__all__ = (
     'Limit',
     'LowerLimit',
     'LowerInfiniteLimit',
@@ -52,7 +100,6 @@ __all__ = [
     'ClosedInterval',
     'OpenBoundedInterval',
     'OpenFiniteInterval',
-    'OpenBoundedInterval',
     'LowerClosedInterval',
     'UpperClosedInterval',
     'LowerOpenInterval',
@@ -60,4 +107,4 @@ __all__ = [
     'ChainableInterval',
     'IntervalChain',
     'IntervalMapping',
-]
+)
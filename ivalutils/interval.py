@@ -133,8 +133,9 @@ Intervals can be compared:
 
 
 # standard library imports
-from collections import Container
-from functools import total_ordering
+from collections.abc import Container
+from math import inf
+from numbers import Real
 import operator
 
 
@@ -172,14 +173,6 @@ class _Inf:
 
     symbol = INFINITY_SYMBOL
 
-    def __new__(cls):
-        try:
-            return cls._the_one_and_only
-        except AttributeError:
-            inf = object.__new__(cls)
-            cls._the_one_and_only = inf
-            return inf
-
     def __repr__(self):
         return "%s()" % self.__class__.__name__         # pragma: no cover
 
@@ -187,13 +180,15 @@ class _Inf:
         return self.symbol
 
 
-@total_ordering
 class Inf(_Inf):
 
     """Value representing (positive) infinity."""
 
     symbol = '+' + INFINITY_SYMBOL
 
+    def __new__(cls):
+        return _INF
+
     def __eq__(self, other):
         # singletons can savely be compared by identity
         return other is self
@@ -202,16 +197,27 @@ class Inf(_Inf):
     __hash__ = object.__hash__
 
     # there's nothing greater
+    def __lt__(self, other):
+        return False
+
     __le__ = __eq__
 
+    def __gt__(self, other):
+        return other is not self
+
+    def __ge__(self, other):
+        return True
+
 
-@total_ordering
 class NegInf(_Inf):
 
     """Value representing negative infinity."""
 
     symbol = '-' + INFINITY_SYMBOL
 
+    def __new__(cls):
+        return _NEG_INF
+
     def __eq__(self, other):
         # singletons can savely be compared by identity
         return other is self
@@ -220,9 +226,23 @@ class NegInf(_Inf):
     __hash__ = object.__hash__
 
     # there's nothing smaller
+    def __lt__(self, other):
+        return other is not self
+
+    def __le__(self, other):
+        return True
+
+    def __gt__(self, other):
+        return False
+
     __ge__ = __eq__
 
 
+# the singletons
+_INF = object.__new__(Inf)
+_NEG_INF = object.__new__(NegInf)
+
+
 # --- Limits ---
 
 class AbstractLimit:
@@ -231,9 +251,6 @@ class AbstractLimit:
 
     __slots__ = ()
 
-    # used to map (is_lower, is_closed) to operator in method is_observed_by
-    _ops = ((operator.lt, operator.le), (operator.gt, operator.ge))
-
     def __init__(self):                                 # pragma: no cover
         raise NotImplementedError
 
@@ -250,11 +267,6 @@ class AbstractLimit:
         """The limiting value."""
         return self._value
 
-    def is_observed_by(self, value):
-        """True if value does not exceed the limit."""
-        op = self._ops[self.is_lower()][self.is_closed()]
-        return op(value, self.value)
-
     def is_closed(self):
         """True if self is closed endpoint, False otherwise."""
         return self._closed
@@ -297,7 +309,6 @@ class AbstractLimit:
             return "%s%s" % (value, UPPER_LIMIT_SYMBOLS[self.is_closed()])
 
 
-@total_ordering
 class InfiniteLimit(AbstractLimit):
 
     """Lower / upper limit of an unbounded (aka infinite) Interval.
@@ -313,7 +324,7 @@ class InfiniteLimit(AbstractLimit):
         AssertionError: `lower` is not instance of `bool`
     """
 
-    __slots__ = ['_lower']
+    __slots__ = ['_lower', '_value']
 
     # dict holding singletons for lower and upper infinite limit
     _singletons = {}
@@ -329,19 +340,21 @@ class InfiniteLimit(AbstractLimit):
 
     def __init__(self, lower):
         self._lower = lower
+        self._value = _NEG_INF if lower else _INF
 
     @property
     def value(self):
         """Lower / upper infinity."""
-        if self.is_lower():
-            return NegInf()
-        else:
-            return Inf()
+        return self._value
 
     def is_closed(self):
         """False (infinite endpoints is always open)."""
         return False
 
+    def is_observed_by(self, value):
+        """True (an infinite limit can not be exceeded)."""
+        return True
+
     def adjacent_limit(self):
         """Return None because an infinite limit has no adjacent limit."""
         return None
@@ -355,31 +368,66 @@ class InfiniteLimit(AbstractLimit):
         # singletons can savely be compared by identity
         return other is self
 
+    # self is lower limit => self.value == NegInf and
+    # self is upper limit => self.value == Inf,
+    # so we can savely delegate comparisons to the values
+
     def __lt__(self, other):
         """self < other"""
-        # self is lower limit => self.value == NegInf and
-        # self is upper limit => self.value == Inf,
-        # so we can savely delegate comparison to the values
         try:
-            return self.value < other.value
+            return self._value < other.value
         except AttributeError:
             # other is not a Limit, so take it as value
-            return self.value < other
+            return self._value < other
+
+    def __le__(self, other):
+        """self <= other"""
+        try:
+            return self._value <= other.value
+        except AttributeError:
+            # other is not a Limit, so take it as value
+            return self._value <= other
+
+    def __gt__(self, other):
+        """self > other"""
+        try:
+            return self._value > other.value
+        except AttributeError:
+            # other is not a Limit, so take it as value
+            return self._value > other
+
+    def __ge__(self, other):
+        """self >= other"""
+        try:
+            return self._value >= other.value
+        except AttributeError:
+            # other is not a Limit, so take it as value
+            return self._value >= other
+
+    def __reduce__(self):
+        # unpickling must hand out the singletons
+        if self._lower:
+            return LowerInfiniteLimit, ()
+        return UpperInfiniteLimit, ()
 
     def __repr__(self):                                 # pragma: no cover
         return "%sInfiniteLimit()" % ['Upper', 'Lower'][self.is_lower()]
 
 
+_LOWER_INF = InfiniteLimit(True)
+_UPPER_INF = InfiniteLimit(False)
+
+
 # Two factory functions for creating the infinite limits
 
 def LowerInfiniteLimit():
     """Create a lower infinite limit (a singleton)."""
-    return InfiniteLimit(True)
+    return _LOWER_INF
 
 
 def UpperInfiniteLimit():
     """Create an upper infinite limit (a singleton)."""
-    return InfiniteLimit(False)
+    return _UPPER_INF
 
 
 class Limit(AbstractLimit):
@@ -400,89 +448,253 @@ class Limit(AbstractLimit):
         instance of :class:`Limit`
 
     Raises:
-        AssertionError: `lower` is not instance of `bool`
-        AssertionError: `value` is None
-        AssertionError: `closed` is not instance of `bool`
+        TypeError: `lower` is not instance of `bool`
+        TypeError: `value` is None
+        TypeError: `closed` is not instance of `bool`
     """
 
-    __slots__ = ['_lower', '_value', '_closed']
+    # `lower` and `closed` are fixed per concrete subclass (see below), so
+    # instances only carry the limiting value, the limit type (kept per
+    # instance because slot access is faster than class attribute lookup)
+    # and some cached attributes; instances of subclasses defined elsewhere
+    # keep `lower` and `closed` in their instance dict
+    __slots__ = ['_value', '_limit_type', '_hash', '_adjacent']
 
-    def __init__(self, lower, value, closed=True):
-        assert isinstance(lower, bool)
+    def __new__(cls, lower, value, closed=True):
         # prevent undefined limit
-        assert value is not None
+        if (type(lower) is not bool or type(closed) is not bool or
+                value is None):
+            raise TypeError("Limit needs a value (not None) and bool flags "
+                            "`lower` and `closed`.")
         # for infinite limit use InfiniteLimit
         assert not isinstance(value, _Inf)
+        if cls is Limit:
+            cls = _LIMIT_CLASSES[lower][closed]
+        return object.__new__(cls)
+
+    def __init__(self, lower, value, closed=True):
         #???: Check whether type of value defines an ordering?
-        assert isinstance(closed, bool)
-        self._lower = lower
         self._value = value
-        self._closed = closed
+        try:
+            self._limit_type = self._type_of_limit
+        except AttributeError:
+            # subclass defined elsewhere
+            self._lower = lower
+            self._closed = closed
+            self._limit_type = 0 if closed else 1 if lower else -1
 
-    def _map_limit_type(self):
-        # upper+open < closed < lower+open
-        if self.is_closed():
-            return 0
-        if self.is_lower():
-            return 1
-        return -1
+    def __reduce__(self):
+        # only the defining data is pickled, cached attributes are not (hash
+        # values of str and bytes differ between processes)
+        return (self.__class__, (self._lower, self._value, self._closed),
+                getattr(self, '__dict__', None))
 
-    def _compare(self, other, op):
-        if isinstance(other, Limit):
-            self_val, other_val = self.value, other.value
-            try:
-                if self_val == other_val:
-                    # if limit values are equal, result depends on limit types
-                    return op(self._map_limit_type(), other._map_limit_type())
-                return op(self_val, other_val)
-            except TypeError as exc:
-                raise IncompatibleLimits(*exc.args)
-        else:
-            self_val = self.value
-            try:
-                # is other comparable to self.value?
-                if self_val == other:
-                    # if values are equal, result depends on limit type
-                    return op(self._map_limit_type(), 0)
-                return op(self_val, other)
-            except TypeError:                           # pragma: no cover
-                return NotImplemented
+    def is_observed_by(self, value):
+        """True if value does not exceed the limit."""
+        if self._lower:
+            if self._closed:
+                return value >= self._value
+            return value > self._value
+        if self._closed:
+            return value <= self._value
+        return value < self._value
 
     def adjacent_limit(self):
         """Return the limit adjacent to self."""
-        return Limit(not self.is_lower(), self.value, not self.is_closed())
+        # limits are immutable, so the adjacent limit is created only once
+        try:
+            return self._adjacent
+        except AttributeError:
+            self._adjacent = adjacent = Limit(not self._lower, self._value,
+                                              not self._closed)
+            return adjacent
 
     def __hash__(self):
         """hash(self)"""
-        return hash((self.is_lower(), self.value, self.is_closed()))
+        # limits are immutable, so the hash value is calculated only once
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash_val = hash((self._lower, self._value,
+                                          self._closed))
+            return hash_val
 
     def __eq__(self, other):
         """self == other"""
-        return self._compare(other, operator.eq)
+        if isinstance(other, Limit):
+            self_val, other_val = self._value, other._value
+            try:
+                if self_val == other_val:
+                    # if limit values are equal, result depends on limit types
+                    return self._limit_type == other._limit_type
+                return False
+            except TypeError as exc:
+                raise IncompatibleLimits(*exc.args)
+        self_val = self._value
+        try:
+            # is other comparable to self.value?
+            if self_val == other:
+                # if values are equal, result depends on limit type
+                return self._limit_type == 0
+            return False
+        except TypeError:                               # pragma: no cover
+            return NotImplemented
 
     def __lt__(self, other):
         """self < other"""
-        return self._compare(other, operator.lt)
+        if isinstance(other, Limit):
+            self_val, other_val = self._value, other._value
+            try:
+                if self_val == other_val:
+                    # if limit values are equal, result depends on limit types
+                    return self._limit_type < other._limit_type
+                return self_val < other_val
+            except TypeError as exc:
+                raise IncompatibleLimits(*exc.args)
+        self_val = self._value
+        try:
+            # is other comparable to self.value?
+            if self_val == other:
+                # if values are equal, result depends on limit type
+                return self._limit_type < 0
+            return self_val < other
+        except TypeError:                               # pragma: no cover
+            return NotImplemented
 
     def __le__(self, other):
         """self <= other"""
-        return self._compare(other, operator.le)
+        if isinstance(other, Limit):
+            self_val, other_val = self._value, other._value
+            try:
+                if self_val == other_val:
+                    # if limit values are equal, result depends on limit types
+                    return self._limit_type <= other._limit_type
+                return self_val <= other_val
+            except TypeError as exc:
+                raise IncompatibleLimits(*exc.args)
+        self_val = self._value
+        try:
+            # is other comparable to self.value?
+            if self_val == other:
+                # if values are equal, result depends on limit type
+                return self._limit_type <= 0
+            return self_val <= other
+        except TypeError:                               # pragma: no cover
+            return NotImplemented
 
     def __gt__(self, other):
         """self > other"""
-        return self._compare(other, operator.gt)
+        if isinstance(other, Limit):
+            self_val, other_val = self._value, other._value
+            try:
+                if self_val == other_val:
+                    # if limit values are equal, result depends on limit types
+                    return self._limit_type > other._limit_type
+                return self_val > other_val
+            except TypeError as exc:
+                raise IncompatibleLimits(*exc.args)
+        self_val = self._value
+        try:
+            # is other comparable to self.value?
+            if self_val == other:
+                # if values are equal, result depends on limit type
+                return self._limit_type > 0
+            return self_val > other
+        except TypeError:                               # pragma: no cover
+            return NotImplemented
 
     def __ge__(self, other):
         """self >= other"""
-        return self._compare(other, operator.ge)
+        if isinstance(other, Limit):
+            self_val, other_val = self._value, other._value
+            try:
+                if self_val == other_val:
+                    # if limit values are equal, result depends on limit types
+                    return self._limit_type >= other._limit_type
+                return self_val >= other_val
+            except TypeError as exc:
+                raise IncompatibleLimits(*exc.args)
+        self_val = self._value
+        try:
+            # is other comparable to self.value?
+            if self_val == other:
+                # if values are equal, result depends on limit type
+                return self._limit_type >= 0
+            return self_val >= other
+        except TypeError:                               # pragma: no cover
+            return NotImplemented
 
     def __repr__(self):                                 # pragma: no cover
-        return "%s(%s, %s, %s)" % (self.__class__.__name__,
+        cls = self.__class__
+        # the concrete classes defined below are presented as Limit
+        name = 'Limit' if cls.__module__ == __name__ else cls.__name__
+        return "%s(%s, %s, %s)" % (name,
                                    self.is_lower(),
                                    repr(self.value),
                                    self.is_closed())
 
 
+# Concrete classes of limits, instantiated via Limit(lower, value, closed).
+# Attribute `_type_of_limit` is used to order limits with equal values:
+# upper+open < closed < lower+open
+
+class _LowerClosedLimit(Limit):
+
+    __slots__ = ()
+
+    _lower = True
+    _closed = True
+    _type_of_limit = 0
+
+    def is_observed_by(self, value):
+        """True if value does not exceed the limit."""
+        return value >= self._value
+
+
+class _LowerOpenLimit(Limit):
+
+    __slots__ = ()
+
+    _lower = True
+    _closed = False
+    _type_of_limit = 1
+
+    def is_observed_by(self, value):
+        """True if value does not exceed the limit."""
+        return value > self._value
+
+
+class _UpperClosedLimit(Limit):
+
+    __slots__ = ()
+
+    _lower = False
+    _closed = True
+    _type_of_limit = 0
+
+    def is_observed_by(self, value):
+        """True if value does not exceed the limit."""
+        return value <= self._value
+
+
+class _UpperOpenLimit(Limit):
+
+    __slots__ = ()
+
+    _lower = False
+    _closed = False
+    _type_of_limit = -1
+
+    def is_observed_by(self, value):
+        """True if value does not exceed the limit."""
+        return value < self._value
+
+
+# used to map (lower, closed) to concrete limit class
+_LIMIT_CLASSES = ((_UpperOpenLimit, _UpperClosedLimit),
+                  (_LowerOpenLimit, _LowerClosedLimit))
+
+
 # Some factory functions for creating limits
 
 def LowerLimit(value, closed=True):
@@ -500,8 +712,8 @@ def LowerLimit(value, closed=True):
         instance of :class:`Limit`
 
     Raises:
-        AssertionError: `value` is None
-        AssertionError: `closed` is not instance of `bool`
+        TypeError: `value` is None
+        TypeError: `closed` is not instance of `bool`
     """
     return Limit(True, value, closed)
 
@@ -521,8 +733,8 @@ def UpperLimit(value, closed=True):
         instance of :class:`Limit`
 
     Raises:
-        AssertionError: `value` is None
-        AssertionError: `closed` is not instance of `bool`
+        TypeError: `value` is None
+        TypeError: `closed` is not instance of `bool`
     """
     return Limit(False, value, closed)
 
@@ -538,7 +750,7 @@ def LowerClosedLimit(value):
         instance of :class:`Limit`
 
     Raises:
-        AssertionError: `value` is None
+        TypeError: `value` is None
     """
     return Limit(True, value, closed=True)
 
@@ -554,7 +766,7 @@ def LowerOpenLimit(value):
         instance of :class:`Limit`
 
     Raises:
-        AssertionError: `value` is None
+        TypeError: `value` is None
     """
     return Limit(True, value, closed=False)
 
@@ -570,7 +782,7 @@ def UpperClosedLimit(value):
         instance of :class:`Limit`
 
     Raises:
-        AssertionError: `value` is None
+        TypeError: `value` is None
     """
     return Limit(False, value, closed=True)
 
@@ -586,7 +798,7 @@ def UpperOpenLimit(value):
         instance of :class:`Limit`
 
     Raises:
-        AssertionError: `value` is None
+        TypeError: `value` is None
     """
     return Limit(False, value, closed=False)
 
@@ -635,65 +847,61 @@ class Interval(Container):
             comparable
     """
 
+    __slots__ = ['_lower_limit', '_upper_limit', '_limits',
+                 '_lo', '_hi', '_lo_closed', '_hi_closed', '_hash',
+                 '__weakref__']
+
     def __init__(self, lower_limit=None, upper_limit=None):
-        if lower_limit is not None and lower_limit != LowerInfiniteLimit():
-            if lower_limit.is_upper():
-                raise InvalidInterval("Given lower limit is an upper limit.")
-            self._lower_limit = lower_limit
-        if upper_limit is not None and upper_limit != UpperInfiniteLimit():
-            if upper_limit.is_lower():
-                raise InvalidInterval("Given upper limit is a lower limit.")
-            self._upper_limit = upper_limit
-        if self.lower_limit > self.upper_limit:
+        if lower_limit is None:
+            lower_limit = _LOWER_INF
+        elif lower_limit.is_upper():
+            raise InvalidInterval("Given lower limit is an upper limit.")
+        if upper_limit is None:
+            upper_limit = _UPPER_INF
+        elif upper_limit.is_lower():
+            raise InvalidInterval("Given upper limit is a lower limit.")
+        if lower_limit > upper_limit:
             raise InvalidInterval("Given lower limit > given upper limit.")
+        self._lower_limit = lower_limit
+        self._upper_limit = upper_limit
+        self._limits = (lower_limit, upper_limit)
+        # if the limits are real numbers, membership can be tested by
+        # comparing plain values (using float infinity for infinite limits)
+        lower_bounded = self.is_lower_bounded()
+        upper_bounded = self.is_upper_bounded()
+        lo = lower_limit.value if lower_bounded else -inf
+        hi = upper_limit.value if upper_bounded else inf
+        if ((lower_bounded or upper_bounded) and
+                isinstance(lo, Real) and isinstance(hi, Real)):
+            self._lo = lo
+            self._hi = hi
+            self._lo_closed = lower_limit.is_closed() or not lower_bounded
+            self._hi_closed = upper_limit.is_closed() or not upper_bounded
+        else:
+            self._lo = self._hi = None
 
     @property
     def lower_limit(self):
         """Lower limit (LowerInfiniteLimit, if no lower limit was given.)"""
-        try:
-            return self._lower_limit
-        except AttributeError:
-            return LowerInfiniteLimit()
+        return self._lower_limit
 
     @property
     def upper_limit(self):
         """Upper limit (UpperInfiniteLimit, if no upper limit was given.)"""
-        try:
-            return self._upper_limit
-        except AttributeError:
-            return UpperInfiniteLimit()
-
-    @property
-    def _limits(self):
-        limits = []
-        try:
-            limits.append(self._lower_limit)
-        except AttributeError:
-            pass
-        try:
-            limits.append(self._upper_limit)
-        except AttributeError:
-            pass
-        return limits
+        return self._upper_limit
 
     @property
     def limits(self):
         """Lower and upper limit as tuple."""
-        return (self.lower_limit, self.upper_limit)
+        return self._limits
 
     def is_lower_bounded(self):
-        try:
-            return self._lower_limit and True
-        except AttributeError:
-            return False
+        return self._lower_limit is not _LOWER_INF
     # alternate name
     is_left_bounded = is_lower_bounded
 
     def is_upper_bounded(self):
-        try:
-            return self._upper_limit and True
-        except AttributeError:
-            return False
+        return self._upper_limit is not _UPPER_INF
     # alternate name
     is_right_bounded = is_upper_bounded
 
@@ -714,12 +922,12 @@ class Interval(Container):
     is_infinite = is_unbounded
 
     def is_lower_closed(self):
-        return self.lower_limit.is_closed()
+        return self._lower_limit.is_closed()
     # alternate name
     is_left_closed = is_lower_closed
 
     def is_upper_closed(self):
-        return self.upper_limit.is_closed()
+        return self._upper_limit.is_closed()
     # alternate name
     is_right_closed = is_upper_closed
 
@@ -727,12 +935,12 @@ class Interval(Container):
         return self.is_lower_closed() and self.is_upper_closed()
 
     def is_lower_open(self):
-        return self.lower_limit.is_open()
+        return self._lower_limit.is_open()
     # alternate name
     is_left_open = is_lower_open
 
     def is_upper_open(self):
-        return self.upper_limit.is_open()
+        return self._upper_limit.is_open()
     # alternate name
     is_right_open = is_upper_open
 
@@ -741,7 +949,25 @@ class Interval(Container):
 
     def __contains__(self, value):
         """True if value does not exceed the limits of self."""
-        return all((limit.is_observed_by(value) for limit in self._limits))
+        lo = self._lo
+        if lo is None:
+            return (self._lower_limit.is_observed_by(value) and
+                    self._upper_limit.is_observed_by(value))
+        hi = self._hi
+        return ((value >= lo if self._lo_closed else value > lo) and
+                (value <= hi if self._hi_closed else value < hi))
+
+    def contains_many(self, values):
+        """Return a list telling for each of the given values whether it is
+        contained in self."""
+        lo = self._lo
+        if lo is None:
+            contains = self.__contains__
+            return [contains(value) for value in values]
+        hi = self._hi
+        lo_op = operator.ge if self._lo_closed else operator.gt
+        hi_op = operator.le if self._hi_closed else operator.lt
+        return [lo_op(value, lo) and hi_op(value, hi) for value in values]
 
     def __eq__(self, other):
         """self == other.
@@ -750,8 +976,10 @@ class Interval(Container):
         and all elements contained in other are also contained in self.
 
         This is exactly the case if self.limits == other.limits."""
+        if self is other:
+            return True
         if isinstance(other, Interval):
-            return self.limits == other.limits
+            return self._limits == other._limits
         return NotImplemented
 
     def __lt__(self, other):
@@ -762,14 +990,18 @@ class Interval(Container):
         than all elements in self.
 
         This is exactly the case if self.limits < other.limits."""
+        if self is other:
+            return False
         if isinstance(other, Interval):
-            return self.limits < other.limits
+            return self._limits < other._limits
         return NotImplemented
 
     def __le__(self, other):
         """self <= other."""
+        if self is other:
+            return True
         if isinstance(other, Interval):
-            return self.limits <= other.limits
+            return self._limits <= other._limits
         return NotImplemented
 
     def __gt__(self, other):
@@ -780,28 +1012,32 @@ class Interval(Container):
         than all elements in self.
 
         This is exactly the case if self.limits > other.limits."""
+        if self is other:
+            return False
         if isinstance(other, Interval):
-            return self.limits > other.limits
+            return self._limits > other._limits
         return NotImplemented
 
     def __ge__(self, other):
         """self >= other."""
+        if self is other:
+            return True
         if isinstance(other, Interval):
-            return self.limits >= other.limits
+            return self._limits >= other._limits
         return NotImplemented
 
     def is_subset(self, other):
         """True if self defines a proper subset of other, i.e. all elements
         contained in self are also contained in other, but not the other way
         round."""
-        return (self.lower_limit >= other.lower_limit and
-                self.upper_limit <= other.upper_limit and
+        return (self._lower_limit >= other._lower_limit and
+                self._upper_limit <= other._upper_limit and
                 self != other)
 
     def is_disjoint(self, other):
         """True if self contains no elements in common with other."""
-        return (self.lower_limit > other.upper_limit or
-                self.upper_limit < other.lower_limit)
+        return (self._lower_limit > other._upper_limit or
+                self._upper_limit < other._lower_limit)
 
     def is_overlapping(self, other):
         """True if there is a common element in self and other."""
@@ -809,11 +1045,11 @@ class Interval(Container):
 
     def is_lower_adjacent(self, other):
         """True if self.upper_limit.is_lower_adjacent(other.lower_limit)."""
-        return self.upper_limit.is_lower_adjacent(other.lower_limit)
+        return self._upper_limit.is_lower_adjacent(other._lower_limit)
 
     def is_upper_adjacent(self, other):
         """True if self.lower_limit.is_upper_adjacent(other.upper_limit)."""
-        return self.lower_limit.is_upper_adjacent(other.upper_limit)
+        return self._lower_limit.is_upper_adjacent(other._upper_limit)
 
     def is_adjacent(self, other):
         """True if self.is_lower_adjacent(other) or
@@ -826,8 +1062,12 @@ class Interval(Container):
             if self.is_disjoint(other):
                 raise InvalidInterval("Intervals are disjoint, " +
                                       "so intersection is not an Interval.")
-            lower_limit = max(self.lower_limit, other.lower_limit)
-            upper_limit = min(self.upper_limit, other.upper_limit)
+            lower_limit, upper_limit = self._limits
+            other_lower_limit, other_upper_limit = other._limits
+            if other_lower_limit > lower_limit:
+                lower_limit = other_lower_limit
+            if other_upper_limit < upper_limit:
+                upper_limit = other_upper_limit
             return Interval(lower_limit, upper_limit)
         return NotImplemented
 
@@ -835,8 +1075,12 @@ class Interval(Container):
         """self | other"""
         if isinstance(other, Interval):
             if self.is_overlapping(other) or self.is_adjacent(other):
-                lower_limit = min(self.lower_limit, other.lower_limit)
-                upper_limit = max(self.upper_limit, other.upper_limit)
+                lower_limit, upper_limit = self._limits
+                other_lower_limit, other_upper_limit = other._limits
+                if other_lower_limit < lower_limit:
+                    lower_limit = other_lower_limit
+                if other_upper_limit > upper_limit:
+                    upper_limit = other_upper_limit
                 return Interval(lower_limit, upper_limit)
             raise InvalidInterval("Intervals are disjoint and not adjacent, "
                                   "so union is not an Interval")
@@ -845,19 +1089,23 @@ class Interval(Container):
     def __sub__(self, other):
         """self - other"""
         if isinstance(other, Interval):
-            if self.lower_limit >= other.lower_limit:
-                if self.upper_limit <= other.upper_limit:
+            if self._lower_limit >= other._lower_limit:
+                if self._upper_limit <= other._upper_limit:
                     raise InvalidInterval("self is subset of other, "
                                           "so result is not an Interval.")
                 else:
-                    lower_limit = max(self.lower_limit,
-                                      other.upper_limit.adjacent_limit())
-                    upper_limit = self.upper_limit
+                    lower_limit = self._lower_limit
+                    adjacent_limit = other._upper_limit.adjacent_limit()
+                    if adjacent_limit > lower_limit:
+                        lower_limit = adjacent_limit
+                    upper_limit = self._upper_limit
             else:
-                if self.upper_limit <= other.upper_limit:
-                    lower_limit = self.lower_limit
-                    upper_limit = min(self.upper_limit,
-                                      other.lower_limit.adjacent_limit())
+                if self._upper_limit <= other._upper_limit:
+                    lower_limit = self._lower_limit
+                    upper_limit = self._upper_limit
+                    adjacent_limit = other._lower_limit.adjacent_limit()
+                    if adjacent_limit < upper_limit:
+                        upper_limit = adjacent_limit
                 else:
                     raise InvalidInterval("other is subset of self, "
                                           "so result is not an Interval.")
@@ -866,7 +1114,18 @@ class Interval(Container):
 
     def __hash__(self):
         """hash(self)"""
-        return hash(self.limits)
+        # intervals are immutable, so the hash value is calculated only once
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash_val = hash(self._limits)
+            return hash_val
+
+    def __reduce__(self):
+        # only the defining data is pickled, derived and cached attributes
+        # are not (hash values of str and bytes differ between processes)
+        return (self.__class__, self._limits,
+                getattr(self, '__dict__', None))
 
     def __copy__(self):
         """Return self (Interval instances are immutable)."""
@@ -876,14 +1135,17 @@ class Interval(Container):
         return self.__copy__()
 
     def __repr__(self):
-        params = ["%s_limit=%r" % (['upper', 'lower'][l.is_lower()], l)
-                  for l in self._limits]
+        params = []
+        if self.is_lower_bounded():
+            params.append("lower_limit=%r" % self._lower_limit)
+        if self.is_upper_bounded():
+            params.append("upper_limit=%r" % self._upper_limit)
         return "%s(%s)" % (self.__class__.__name__, ', '.join(params))
 
     def __str__(self):
-        return "%s %s %s" % (self.lower_limit,
+        return "%s %s %s" % (self._lower_limit,
                              INTERVAL_SYMBOL,
-                             self.upper_limit)
+                             self._upper_limit)
 
 
 # Some factory functions for creating intervals
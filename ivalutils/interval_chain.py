@@ -67,12 +67,14 @@ value:
 
 
 # standard library imports
-from collections import Sequence
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
 
 # local import
-from .interval import (ChainableInterval, Interval, InvalidInterval,
-                       LowerClosedInterval, LowerOpenInterval,
-                       UpperClosedInterval, UpperOpenInterval)
+from .interval import (ChainableInterval, IncompatibleLimits, Interval,
+                       InvalidInterval,
+                       LowerClosedInterval, LowerLimit, LowerOpenInterval,
+                       UpperClosedInterval, UpperLimit, UpperOpenInterval)
 
 
 __metaclass__ = type
@@ -83,6 +85,63 @@ class EmptyIntervalChain(Exception):
     """Raised when an empty IntervalChain would be created."""
 
 
+def _build_ivals(limits, lower_closed, add_lower_inf, add_upper_inf):
+    if add_lower_inf:
+        # lower infinite interval
+        if lower_closed:
+            head = (UpperOpenInterval(limits[0]),)
+        else:
+            head = (UpperClosedInterval(limits[0]),)
+    else:
+        head = ()
+    # chainable intervals from values in limits
+    mid = tuple([ChainableInterval(lower_value, upper_value,
+                                   lower_closed=lower_closed)
+                 for (lower_value, upper_value)
+                 in zip(limits, limits[1:])])
+    if add_upper_inf:
+        # upper infinite interval
+        if lower_closed:
+            tail = (LowerClosedInterval(limits[-1]),)
+        else:
+            tail = (LowerOpenInterval(limits[-1]),)
+    else:
+        tail = ()
+    return head + mid + tail
+
+
+def _check_limits(limits):
+    # the intervals are created lazily, so the limits are checked in advance
+    # (like the limits of the intervals would do): they must not be None,
+    # must be comparable and given in ascending order
+    if None in limits:
+        raise TypeError("Limits must not be None.")
+    try:
+        for lower_value, upper_value in zip(limits[:-1], limits[1:]):
+            if lower_value == upper_value or lower_value > upper_value:
+                raise InvalidInterval(
+                    "Limits must be given in ascending order.")
+    except TypeError as exc:
+        raise IncompatibleLimits(*exc.args)
+
+
+def _get_stride(limits, lower_closed):
+    # returns (base, step, number of limits) if limits are equidistant
+    # integers, otherwise None
+    n = len(limits)
+    if n < 2 or not all(type(limit) is int for limit in limits):
+        return None
+    first = limits[0]
+    step = limits[1] - first
+    if step <= 0 or limits != tuple(range(first, first + n * step, step)):
+        return None
+    # for integer values, the number of limits not greater than value
+    # (lower-closed intervals) resp. less than value (lower-open intervals)
+    # then is (value - base) // step + 1
+    base = first if lower_closed else first + 1
+    return base, step, n
+
+
 class IntervalChain(Sequence):
 
     """An IntervalChain is a list of adjacent intervals.
@@ -112,8 +171,13 @@ class IntervalChain(Sequence):
         InvalidInterval: given limits do not define a sequence of adjacent
             intervals
         IncompatibleLimits: given limits are not comparable
+        TypeError: one of the given limits is None
     """
 
+    __slots__ = ['_limits', '_lower_closed', '_lower_inf', '_upper_inf',
+                 '_ivals', '_len', '_bisect', '_offset', '_stride',
+                 '_total_interval', '_repr', '_str', '__weakref__']
+
     def __init__(self, limits, lower_closed=True, add_lower_inf=False,
                  add_upper_inf=True):
         n = len(limits)
@@ -121,36 +185,24 @@ class IntervalChain(Sequence):
             raise EmptyIntervalChain(
                 "Given limits do not define any interval.")
         # the iterable 'limits' needs to be copied
-        self._limits = tuple(limits)
-        self._lower_closed = lower_closed
-        ivals = []
-        if add_lower_inf:
-            # add lower infinite interval
-            if lower_closed:
-                ivals.append(UpperOpenInterval(limits[0]))
-            else:
-                ivals.append(UpperClosedInterval(limits[0]))
-            self._lower_inf = True
-        else:
-            self._lower_inf = False
-        # create chainable interval from values in limits
-        try:
-            ivals.extend([ChainableInterval(lower_value, upper_value,
-                                            lower_closed=lower_closed)
-                          for (lower_value, upper_value)
-                          in zip(limits[:-1], limits[1:])])
-        except InvalidInterval:
-            raise InvalidInterval("Limits must be given in ascending order.")
-        if add_upper_inf:
-            # add upper infinite interval
-            if lower_closed:
-                ivals.append(LowerClosedInterval(limits[-1]))
-            else:
-                ivals.append(LowerOpenInterval(limits[-1]))
-            self._upper_inf = True
-        else:
-            self._upper_inf = False
-        self._ivals = ivals
+        self._limits = limits = tuple(limits)
+        _check_limits(limits)
+        self._lower_closed = bool(lower_closed)
+        self._lower_inf = bool(add_lower_inf)
+        self._upper_inf = bool(add_upper_inf)
+        # the intervals are not needed for mapping values to indices, so
+        # they are created on first access (see _get_ivals)
+        # n limits define n - 1 bounded intervals, plus the infinite ones
+        self._len = n - 1 + int(add_lower_inf) + int(add_upper_inf)
+        # used in map2idx: binary search on the limiting values, the number
+        # of limits not greater than value (lower-closed intervals) resp. less
+        # than value (lower-open intervals) gives the index of the interval,
+        # shifted by one if there is no lower infinite interval
+        self._bisect = bisect_right if lower_closed else bisect_left
+        self._offset = 0 if add_lower_inf else 1
+        # if the limits are equidistant integers, the position of an integer
+        # value can be calculated directly
+        self._stride = _get_stride(limits, lower_closed)
 
     @property
     def limits(self):
@@ -161,7 +213,26 @@ class IntervalChain(Sequence):
     def total_interval(self):
         """Returns the interval between lower endpoint of first interval in
         self and upper endpoint of last interval in self."""
-        return Interval(self[0].lower_limit, self[-1].upper_limit)
+        # interval chains are immutable, so the total interval is created
+        # only once
+        try:
+            return self._total_interval
+        except AttributeError:
+            pass
+        # derived from the limiting values, without touching the intervals
+        limits = self._limits
+        lower_closed = self._lower_closed
+        if self._lower_inf:
+            lower_limit = None
+        else:
+            lower_limit = LowerLimit(limits[0], closed=lower_closed)
+        if self._upper_inf:
+            upper_limit = None
+        else:
+            upper_limit = UpperLimit(limits[-1], closed=not lower_closed)
+        self._total_interval = total_interval = Interval(lower_limit,
+                                                         upper_limit)
+        return total_interval
 
     def is_lower_infinite(self):
         """True if first interval is lower infinite."""
@@ -177,52 +248,124 @@ class IntervalChain(Sequence):
 
         Raises ValueError if value is not contained in any of the intervals in
         self."""
-        n = len(self)
-        # using binary search
-        left, right = (0, n - 1)
-        while left <= right:
-            idx = (right + left) // 2
-            ival = self[idx]
-            if value in ival:
-                return idx
-            if value < ival.lower_limit:
-                right = idx - 1
-            else:
-                left = idx + 1
+        stride = self._stride
+        if stride is not None and type(value) is int:
+            base, step, n_limits = stride
+            pos = (value - base) // step + 1
+            if pos < 0:
+                pos = 0
+            elif pos > n_limits:
+                pos = n_limits
+            idx = pos - self._offset
+        else:
+            idx = self._bisect_checked(value) - self._offset
+        if 0 <= idx < self._len:
+            return idx
+        raise ValueError("%r not in any interval of %r." % (value, self))
+
+    def _bisect_checked(self, value):
+        # bisecting presumes that value is totally ordered with respect to
+        # the limits (which is not the case for NaN, for example), so the
+        # position found is checked against the neighbouring limits
+        limits = self._limits
+        pos = self._bisect(limits, value)
+        if self._lower_closed:
+            if ((pos == 0 or limits[pos - 1] <= value) and
+                    (pos == len(limits) or value < limits[pos])):
+                return pos
+        else:
+            if ((pos == 0 or limits[pos - 1] < value) and
+                    (pos == len(limits) or value <= limits[pos])):
+                return pos
         raise ValueError("%r not in any interval of %r." % (value, self))
 
+    def map2idx_many(self, values):
+        """Return a list of the indices of the intervals which contain the
+        given values.
+
+        Raises ValueError if one of the values is not contained in any of the
+        intervals in self."""
+        bisect = self._bisect_checked
+        offset = self._offset
+        n = self._len
+        idxs = []
+        append = idxs.append
+        for value in values:
+            idx = bisect(value) - offset
+            if not 0 <= idx < n:
+                raise ValueError("%r not in any interval of %r."
+                                 % (value, self))
+            append(idx)
+        return idxs
+
     def __copy__(self):
         """Return self (IntervalChain instances are immutable)."""
         return self
 
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
     def __eq__(self, other):
         """self == other"""
+        if self is other:
+            return True
         if isinstance(other, IntervalChain):
-            # interval chains are equal if their intervals are equal
-            return self is other or self._ivals == other._ivals
+            # interval chains are equal if their intervals are equal, which
+            # is the case if their parameters and limits are equal (checking
+            # the parameters first, because that's cheap)
+            return (self._lower_closed == other._lower_closed and
+                    self._lower_inf == other._lower_inf and
+                    self._upper_inf == other._upper_inf and
+                    self._limits == other._limits)
         return NotImplemented
 
+    def _get_ivals(self):
+        # interval chains are immutable, so the intervals are created only
+        # once
+        try:
+            return self._ivals
+        except AttributeError:
+            self._ivals = ivals = _build_ivals(self._limits,
+                                               self._lower_closed,
+                                               self._lower_inf,
+                                               self._upper_inf)
+            return ivals
+
     def __getitem__(self, idx):
         """self[idx]"""
-        return self._ivals[idx]
+        try:
+            return self._ivals[idx]
+        except AttributeError:
+            return self._get_ivals()[idx]
 
     def __iter__(self):
         """iter(self)"""
-        return iter(self._ivals)
+        return iter(self._get_ivals())
 
     def __len__(self):
         """len(self)"""
-        return len(self._ivals)
+        return self._len
 
     def __repr__(self):
         """repr(self)"""
-        kwds = '' if self._lower_closed else ", lower_closed=False"
-        if self.is_lower_infinite():
-            kwds += ", add_lower_inf=True"
-        if not self.is_upper_infinite():
-            kwds += ", add_upper_inf=False"
-        return "%s(%s%s)" % (self.__class__.__name__, self.limits, kwds)
+        # interval chains are immutable, so repr is built only once
+        try:
+            return self._repr
+        except AttributeError:
+            kwds = '' if self._lower_closed else ", lower_closed=False"
+            if self.is_lower_infinite():
+                kwds += ", add_lower_inf=True"
+            if not self.is_upper_infinite():
+                kwds += ", add_upper_inf=False"
+            self._repr = rep = "%s(%s%s)" % (self.__class__.__name__,
+                                             self.limits, kwds)
+            return rep
 
     def __str__(self):
         """str(self)"""
-        return '[%s]' % ', '.join([str(i) for i in self])
+        # interval chains are immutable, so str is built only once
+        try:
+            return self._str
+        except AttributeError:
+            self._str = s = '[%s]' % ', '.join([str(i) for i in self])
+            return s
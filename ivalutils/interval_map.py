@@ -83,7 +83,8 @@ Use cases for interval mappings are for example:
 
 
 # standard library imports
-from collections import Mapping, Callable
+from collections.abc import Callable, Mapping
+from copy import deepcopy
 
 # local import
 from .interval_chain import IntervalChain
@@ -92,6 +93,10 @@ from .interval_chain import IntervalChain
 __metaclass__ = type
 
 
+# marker for omitted argument
+_NO_DEFAULT = object()
+
+
 class IntervalMapping(Mapping, Callable):
 
     """An IntervalMapping is a container of associated interval / value pairs.
@@ -133,10 +138,12 @@ class IntervalMapping(Mapping, Callable):
         InvalidInterval: given limits do not define a sequence of adjacent
             intervals
         IncompatibleLimits: given limits are not comparable
-        TypeError: given sequence is not a sequence of 2-tuples
+        TypeError: given sequence is not a non-empty sequence of 2-tuples
         TypeError: wrong number of arguments
     """
 
+    __slots__ = ['_keys', '_vals', '_key2idx', '__weakref__']
+
     def __init__(self, *args):
         nargs = len(args)
         if nargs == 2:
@@ -149,9 +156,13 @@ class IntervalMapping(Mapping, Callable):
                 keys = IntervalChain(keys)
         elif nargs == 1:
             try:
-                limits = [t[0] for t in args[0]]
-                vals = [t[1] for t in args[0]]
-            except (TypeError, IndexError):
+                # the items are read only once (args[0] may be an iterator)
+                items = tuple(args[0])
+                limits, vals = zip(*items)
+                # zip silently truncates items holding more than 2 values
+                if any(len(item) != 2 for item in items):
+                    raise ValueError
+            except (TypeError, ValueError):
                 raise TypeError("Expected a sequence of 2-tuples.")
             keys = IntervalChain(limits)
         else:
@@ -172,15 +183,56 @@ class IntervalMapping(Mapping, Callable):
         else:
             return self._vals[idx]
 
+    def map_many(self, vals, default=_NO_DEFAULT):
+        """Return a list of the values associated with the intervals which
+        contain the given `vals`.
+
+        If `default` is given, it is returned for the values not contained in
+        any interval, otherwise KeyError is raised for them.
+        """
+        values = self._vals
+        if default is _NO_DEFAULT:
+            try:
+                idxs = self._keys.map2idx_many(vals)
+            except ValueError as exc:
+                raise KeyError(*exc.args)
+            return [values[idx] for idx in idxs]
+        map2idx = self._keys.map2idx
+        result = []
+        append = result.append
+        for val in vals:
+            try:
+                append(values[map2idx(val)])
+            except ValueError:
+                append(default)
+        return result
+
     def __call__(self, val):
         """Return the value associated with interval which contains `val`.
         """
         return self.map(val)
 
+    def __reduce__(self):
+        # the dict mapping intervals to indices is not pickled (hash values
+        # of str and bytes differ between processes)
+        return (self.__class__, (self._keys, self._vals),
+                getattr(self, '__dict__', None))
+
     def __copy__(self):
         """Return self (IntervalMapping instances are immutable)."""
         return self
 
+    def __deepcopy__(self, memo):
+        """Return a copy of self holding deep copies of the associated values
+        (the interval chain is immutable and therefore shared)."""
+        # the copy is registered in memo before the values are copied, so
+        # values referring to self refer to the copy afterwards
+        result = object.__new__(self.__class__)
+        memo[id(self)] = result
+        result._keys = self._keys
+        result._vals = deepcopy(self._vals, memo)
+        return result
+
     def __eq__(self, other):
         """self == other"""
         if isinstance(other, IntervalMapping):
@@ -192,9 +244,23 @@ class IntervalMapping(Mapping, Callable):
 
     def __getitem__(self, key):
         """self[key]"""
+        # interval mappings are immutable, so the dict mapping intervals to
+        # indices is created only once (if the intervals are not hashable,
+        # it is set to None and the intervals are searched instead)
         try:
-            idx = self._keys.index(key)
-        except ValueError:
+            key2idx = self._key2idx
+        except AttributeError:
+            try:
+                key2idx = {ival: idx for idx, ival in enumerate(self._keys)}
+            except TypeError:
+                key2idx = None
+            self._key2idx = key2idx
+        try:
+            if key2idx is None:
+                idx = self._keys.index(key)
+            else:
+                idx = key2idx[key]
+        except (KeyError, TypeError, ValueError):
             raise KeyError("%s not in %s." % (key, self._keys))
         else:
             return self._vals[idx]
@@ -14,8 +14,13 @@
 import unittest
 from copy import copy, deepcopy
 from datetime import date
-from operator import ge, gt, le, lt, and_, or_, sub
+from decimal import Decimal
+from itertools import product
+from operator import ge, gt, le, lt
+from pickle import dumps, loads
+from random import Random
 from sys import maxsize
+from weakref import ref
 from ivalutils.interval import (
     Inf, NegInf, IncompatibleLimits, Limit, InfiniteLimit, LowerInfiniteLimit,
     UpperInfiniteLimit, LowerLimit, LowerClosedLimit, LowerOpenLimit,
@@ -25,6 +30,17 @@ from ivalutils.interval import (
 )
 
 
+class HashCountingInt(int):
+
+    """Int counting how often its hash value is calculated."""
+
+    n_hash_calls = 0
+
+    def __hash__(self):
+        HashCountingInt.n_hash_calls += 1
+        return int.__hash__(self)
+
+
 class InfinityTests(unittest.TestCase):
 
     def test_infinity_values(self):
@@ -48,12 +64,16 @@ class InfinityTests(unittest.TestCase):
 class LimitTests(unittest.TestCase):
 
     def test_infinite_limits(self):
-        self.assertRaises(AssertionError, InfiniteLimit, '')
+        with self.assertRaises(AssertionError):
+            InfiniteLimit('')
         lower_inf = LowerInfiniteLimit()
         upper_inf = UpperInfiniteLimit()
         # infinite limits are singletons
         self.assertIs(lower_inf, InfiniteLimit(True))
         self.assertIs(upper_inf, InfiniteLimit(False))
+        # ... even when unpickled
+        self.assertIs(loads(dumps(lower_inf)), lower_inf)
+        self.assertIs(loads(dumps(upper_inf)), upper_inf)
         # infinite limits have 'Inf' values (which are singletons)
         self.assertIs(lower_inf.value, NegInf())
         self.assertIs(upper_inf.value, Inf())
@@ -107,6 +127,27 @@ class LimitTests(unittest.TestCase):
         self.assertTrue(lim.is_upper())
         self.assertEqual(lim.value, 5)
         self.assertTrue(lim.is_open())
+        # limits hold exactly the value given, even if equal to a value
+        # given before, and values need not be hashable
+        for factory in (LowerClosedLimit, LowerOpenLimit, UpperClosedLimit,
+                        UpperOpenLimit):
+            for value in (5, 5.0, -0.0, 0.0, Decimal('1.0'), Decimal('1.00'),
+                          [5]):
+                with self.subTest(factory=factory, value=value):
+                    self.assertIs(factory(value).value, value)
+        # invalid args
+        with self.assertRaises(TypeError):
+            Limit(1, 5, True)
+        with self.assertRaises(TypeError):
+            Limit(True, 5, 0)
+        with self.assertRaises(TypeError):
+            Limit(True, None, True)
+        with self.assertRaises(TypeError):
+            LowerLimit(None)
+        with self.assertRaises(TypeError):
+            UpperLimit(5, closed='yes')
+        with self.assertRaises(TypeError):
+            LowerClosedLimit(None)
 
     def test_limit_ops(self):
         lower_closed_limit = LowerClosedLimit(0)
@@ -127,8 +168,8 @@ class LimitTests(unittest.TestCase):
         millenium = date(2000, 1, 1)
         today = date.today()
         self.assertTrue(LowerLimit(millenium) < LowerLimit(today))
-        self.assertRaises(IncompatibleLimits, ge, LowerClosedLimit(today),
-                          LowerOpenLimit('d'))
+        with self.assertRaises(IncompatibleLimits):
+            LowerClosedLimit(today) >= LowerOpenLimit('d')
         # compare limits to values
         self.assertTrue(lower_closed_limit == 0)
         self.assertTrue(upper_closed_limit == 0)
@@ -145,8 +186,49 @@ class LimitTests(unittest.TestCase):
                          upper_closed_limit)
         self.assertEqual(upper_open_limit.adjacent_limit(),
                          lower_closed_limit)
+        self.assertIs(lower_closed_limit.adjacent_limit(),
+                      lower_closed_limit.adjacent_limit())
         self.assertTrue(lower_closed_limit.is_adjacent(upper_open_limit))
         self.assertTrue(upper_open_limit.is_adjacent(lower_closed_limit))
+        # limits check values according to their type
+        self.assertTrue(lower_closed_limit.is_observed_by(0))
+        self.assertFalse(lower_open_limit.is_observed_by(0))
+        self.assertTrue(upper_closed_limit.is_observed_by(0))
+        self.assertFalse(upper_open_limit.is_observed_by(0))
+        self.assertTrue(lower_open_limit.is_observed_by(1))
+        self.assertTrue(upper_open_limit.is_observed_by(-1))
+        # limits can be pickled
+        for lim in (lower_closed_limit, upper_closed_limit, lower_open_limit,
+                    upper_open_limit):
+            self.assertEqual(loads(dumps(lim)), lim)
+            self.assertEqual(repr(loads(dumps(lim))), repr(lim))
+        # ... without their cached hash value (which may differ between
+        # processes)
+        lim = LowerClosedLimit('q')
+        lim._hash = hash(lim) + 1
+        self.assertEqual(hash(loads(dumps(lim))), hash(LowerClosedLimit('q')))
+
+
+    def test_subclass(self):
+        class MyLimit(Limit):
+            pass
+
+        for lower, closed in product((True, False), repeat=2):
+            with self.subTest(lower=lower, closed=closed):
+                lim = MyLimit(lower, 5, closed)
+                self.assertIsInstance(lim, MyLimit)
+                self.assertEqual(lim.is_lower(), lower)
+                self.assertEqual(lim.is_closed(), closed)
+                self.assertEqual(repr(lim),
+                                 'MyLimit(%s, 5, %s)' % (lower, closed))
+                self.assertEqual(lim, Limit(lower, 5, closed))
+                self.assertEqual(hash(lim), hash(Limit(lower, 5, closed)))
+                self.assertEqual(lim.adjacent_limit(),
+                                 Limit(not lower, 5, not closed))
+                for value in (4, 5, 6):
+                    self.assertEqual(
+                        lim.is_observed_by(value),
+                        Limit(lower, 5, closed).is_observed_by(value))
 
 
 class IntervalTests(unittest.TestCase):
@@ -180,79 +262,130 @@ class IntervalTests(unittest.TestCase):
         self.assertEqual(ival.limits, (LowerInfiniteLimit(),
                                        UpperInfiniteLimit()))
         # invalid limits
-        self.assertRaises(InvalidInterval, Interval, lower_limit=upper_limit)
-        self.assertRaises(InvalidInterval, Interval, upper_limit=lower_limit)
+        with self.assertRaises(InvalidInterval):
+            Interval(lower_limit=upper_limit)
+        with self.assertRaises(InvalidInterval):
+            Interval(upper_limit=lower_limit)
         # lower == upper
         upper_limit = UpperClosedLimit(0)
         self.assertIsInstance(Interval(lower_limit, upper_limit), Interval)
         # lower > upper
         upper_limit = UpperOpenLimit(0)
-        self.assertRaises(InvalidInterval, Interval, upper_limit, lower_limit)
+        with self.assertRaises(InvalidInterval):
+            Interval(upper_limit, lower_limit)
         # incompatible limits
         lower_limit = LowerClosedLimit(0)
         upper_limit = UpperClosedLimit(date.today())
-        self.assertRaises(IncompatibleLimits, Interval, lower_limit,
-                          upper_limit)
+        with self.assertRaises(IncompatibleLimits):
+            Interval(lower_limit, upper_limit)
+        # intervals do not carry an instance dict, but can be weakly
+        # referenced
+        self.assertFalse(hasattr(Interval(), '__dict__'))
+        ival = Interval()
+        self.assertIs(ref(ival)(), ival)
+        # intervals created by factories hold exactly the values given
+        for factory in (LowerClosedInterval, LowerOpenInterval):
+            for value in (0.0, -0.0, Decimal('1.0'), Decimal('1.00')):
+                self.assertIs(factory(value).lower_limit.value, value)
+        for factory in (UpperClosedInterval, UpperOpenInterval):
+            for value in (0.0, -0.0, Decimal('1.0'), Decimal('1.00')):
+                self.assertIs(factory(value).upper_limit.value, value)
+        for factory in (ClosedInterval, OpenBoundedInterval,
+                        ChainableInterval):
+            for value in (-0.0, 0.0):
+                self.assertIs(factory(value, 1).lower_limit.value, value)
+        with self.assertRaises(InvalidInterval):
+            ClosedInterval(7, 5)
+
+    def test_pickle(self):
+        for ival in (Interval(), LowerClosedInterval(1),
+                     UpperOpenInterval(1), ClosedInterval(0, 1)):
+            with self.subTest(ival=ival):
+                unpickled = loads(dumps(ival))
+                self.assertEqual(unpickled, ival)
+                self.assertEqual(unpickled.is_lower_bounded(),
+                                 ival.is_lower_bounded())
+                self.assertEqual(unpickled.is_upper_bounded(),
+                                 ival.is_upper_bounded())
+        # the cached hash value (which may differ between processes) is not
+        # pickled
+        ival = ClosedInterval('a', 'z')
+        ival._hash = hash(ival) + 1
+        unpickled = loads(dumps(ival))
+        self.assertEqual(hash(unpickled), hash(ClosedInterval('a', 'z')))
+        self.assertIn(unpickled, {ClosedInterval('a', 'z')})
 
     def test_properties(self):
         lower_limit = LowerClosedLimit(0)
         upper_limit = UpperClosedLimit(1)
-        # closed interval
-        ival = Interval(lower_limit, upper_limit)
-        self.assertTrue(ival.is_lower_bounded())
-        self.assertTrue(ival.is_upper_bounded())
-        self.assertTrue(ival.is_bounded())
-        self.assertFalse(ival.is_lower_unbounded())
-        self.assertFalse(ival.is_upper_unbounded())
-        self.assertFalse(ival.is_unbounded())
-        self.assertTrue(ival.is_lower_closed())
-        self.assertTrue(ival.is_upper_closed())
-        self.assertTrue(ival.is_closed())
-        self.assertFalse(ival.is_lower_open())
-        self.assertFalse(ival.is_upper_open())
-        self.assertFalse(ival.is_open())
-        # upper open interval
-        ival = Interval(lower_limit=lower_limit)
-        self.assertTrue(ival.is_lower_bounded())
-        self.assertFalse(ival.is_upper_bounded())
-        self.assertFalse(ival.is_bounded())
-        self.assertFalse(ival.is_lower_unbounded())
-        self.assertTrue(ival.is_upper_unbounded())
-        self.assertTrue(ival.is_unbounded())
-        self.assertTrue(ival.is_lower_closed())
-        self.assertFalse(ival.is_upper_closed())
-        self.assertFalse(ival.is_closed())
-        self.assertFalse(ival.is_lower_open())
-        self.assertTrue(ival.is_upper_open())
-        self.assertTrue(ival.is_open())
-        # lower open interval
-        ival = Interval(upper_limit=upper_limit)
-        self.assertFalse(ival.is_lower_bounded())
-        self.assertTrue(ival.is_upper_bounded())
-        self.assertFalse(ival.is_bounded())
-        self.assertTrue(ival.is_lower_unbounded())
-        self.assertFalse(ival.is_upper_unbounded())
-        self.assertTrue(ival.is_unbounded())
-        self.assertFalse(ival.is_lower_closed())
-        self.assertTrue(ival.is_upper_closed())
-        self.assertFalse(ival.is_closed())
-        self.assertTrue(ival.is_lower_open())
-        self.assertFalse(ival.is_upper_open())
-        self.assertTrue(ival.is_open())
+        predicates = ('is_lower_bounded', 'is_upper_bounded', 'is_bounded',
+                      'is_lower_unbounded', 'is_upper_unbounded',
+                      'is_unbounded', 'is_lower_closed', 'is_upper_closed',
+                      'is_closed', 'is_lower_open', 'is_upper_open',
+                      'is_open')
+        T, F = True, False
+        for descr, ival, expected in (
+                ('closed', Interval(lower_limit, upper_limit),
+                 (T, T, T, F, F, F, T, T, T, F, F, F)),
+                ('upper open', Interval(lower_limit=lower_limit),
+                 (T, F, F, F, T, T, T, F, F, F, T, T)),
+                ('lower open', Interval(upper_limit=upper_limit),
+                 (F, T, F, T, F, T, F, T, F, T, F, T)),
+                ('unbounded', Interval(),
+                 (F, F, F, T, T, T, F, F, F, T, T, T))):
+            for predicate, result in zip(predicates, expected):
+                with self.subTest(ival=descr, predicate=predicate):
+                    self.assertEqual(bool(getattr(ival, predicate)()),
+                                     result)
+
+    def test_contains(self):
+        # numeric limits
+        ival = ClosedInterval(0, 10)
+        for val in (0, 0.5, 7, 10, 10.0):
+            self.assertTrue(val in ival)
+        for val in (-1, -0.001, 10.5, float('nan')):
+            self.assertFalse(val in ival)
+        ival = OpenBoundedInterval(0, 10)
+        self.assertFalse(0 in ival)
+        self.assertTrue(0.001 in ival)
+        self.assertFalse(10 in ival)
+        ival = LowerOpenInterval(0)
+        self.assertFalse(0 in ival)
+        self.assertTrue(float('inf') in ival)
+        ival = UpperClosedInterval(0)
+        self.assertTrue(0 in ival)
+        self.assertTrue(float('-inf') in ival)
+        self.assertFalse(1 in ival)
+        # non-numeric limits
+        ival = ChainableInterval('b', 'd')
+        self.assertTrue('b' in ival)
+        self.assertTrue('czz' in ival)
+        self.assertFalse('d' in ival)
+        ival = LowerClosedInterval(date(2000, 1, 1))
+        self.assertTrue(date.today() in ival)
+        self.assertFalse(date(1999, 12, 31) in ival)
         # unbounded interval
         ival = Interval()
-        self.assertFalse(ival.is_lower_bounded())
-        self.assertFalse(ival.is_upper_bounded())
-        self.assertFalse(ival.is_bounded())
-        self.assertTrue(ival.is_lower_unbounded())
-        self.assertTrue(ival.is_upper_unbounded())
-        self.assertTrue(ival.is_unbounded())
-        self.assertFalse(ival.is_lower_closed())
-        self.assertFalse(ival.is_upper_closed())
-        self.assertFalse(ival.is_closed())
-        self.assertTrue(ival.is_lower_open())
-        self.assertTrue(ival.is_upper_open())
-        self.assertTrue(ival.is_open())
+        for val in (0, 'a', date.today(), object()):
+            self.assertTrue(val in ival)
+        # incomparable value
+        with self.assertRaises(TypeError):
+            'a' in ClosedInterval(0, 10)
+
+    def test_contains_many(self):
+        values = [-1, 0, 0.5, 7, 10, 10.5, float('nan')]
+        for ival in (ClosedInterval(0, 10), OpenBoundedInterval(0, 10),
+                     LowerOpenInterval(0), UpperOpenInterval(10),
+                     Interval()):
+            self.assertEqual(ival.contains_many(values),
+                             [val in ival for val in values])
+        values = ['a', 'b', 'c', 'd', 'e']
+        ival = ChainableInterval('b', 'd')
+        self.assertEqual(ival.contains_many(values),
+                         [False, True, True, False, False])
+        self.assertEqual(ival.contains_many(iter(values)),
+                         [False, True, True, False, False])
+        self.assertEqual(ival.contains_many([]), [])
 
     def test_hash(self):
         lower_limit = LowerClosedLimit(0)
@@ -260,6 +393,17 @@ class IntervalTests(unittest.TestCase):
         # closed interval
         ival = Interval(lower_limit, upper_limit)
         self.assertEqual(hash(ival), hash((lower_limit, upper_limit)))
+        self.assertEqual(hash(lower_limit), hash((True, 0, True)))
+        # hash values are calculated only once
+        lower_limit = LowerClosedLimit(HashCountingInt(0))
+        ival = Interval(lower_limit, upper_limit)
+        HashCountingInt.n_hash_calls = 0
+        hash_val = hash(ival)
+        self.assertEqual(HashCountingInt.n_hash_calls, 1)
+        self.assertEqual(ival._hash, hash_val)
+        self.assertEqual(hash(ival), hash_val)
+        self.assertEqual(hash(lower_limit), hash((True, 0, True)))
+        self.assertEqual(HashCountingInt.n_hash_calls, 1)
         # upper open interval
         ival = Interval(lower_limit=lower_limit)
         self.assertEqual(hash(ival),
@@ -300,24 +444,20 @@ class IntervalTests(unittest.TestCase):
         self.assertTrue(m != lma)
         self.assertTrue(m != lu)
         self.assertTrue(m != lim)
-        # lt
-        self.assertTrue(lu < lma < lmo < s2 < m < s3 < s1 < umo < uma < uu)
-        self.assertRaises(TypeError, lt, m, lim)
-        self.assertRaises(TypeError, lt, lim, lu)
-        # le
-        self.assertTrue(
-            lu <= lma <= lmo <= s2 <= m <= s3 <= s1 <= umo <= uma <= uu)
-        self.assertRaises(TypeError, le, m, lim)
-        self.assertRaises(TypeError, le, lim, lu)
-        # gt
-        self.assertTrue(uu > uma > umo > s1 > s3 > m > s2 > lmo > lma > lu)
-        self.assertRaises(TypeError, gt, m, lim)
-        self.assertRaises(TypeError, gt, lim, lu)
-        # ge
-        self.assertTrue(
-            uu >= uma >= umo >= s1 >= s3 >= m >= s2 >= lmo >= lma >= lu)
-        self.assertRaises(TypeError, ge, m, lim)
-        self.assertRaises(TypeError, ge, lim, lu)
+        # ordering
+        ordered = [lu, lma, lmo, s2, m, s3, s1, umo, uma, uu]
+        shuffled = Random(0).sample(ordered, len(ordered))
+        self.assertEqual(sorted(shuffled), ordered)
+        self.assertEqual(sorted(shuffled, reverse=True), ordered[::-1])
+        for op, pairs in ((lt, zip(ordered, ordered[1:])),
+                          (le, zip(ordered, ordered[1:])),
+                          (gt, zip(ordered[1:], ordered)),
+                          (ge, zip(ordered[1:], ordered))):
+            self.assertTrue(all(op(ival1, ival2) for ival1, ival2 in pairs))
+            with self.assertRaises(TypeError):
+                op(m, lim)
+            with self.assertRaises(TypeError):
+                op(lim, lu)
 
     def test_set_ops(self):
         uu = LowerClosedInterval(1000)
@@ -342,73 +482,86 @@ class IntervalTests(unittest.TestCase):
         self.assertTrue(not s3.is_subset(umo))
         self.assertTrue(not s3.is_subset(lmo))
         # test __sub__
-        self.assertRaises(InvalidInterval, Interval.__sub__, m, m)
-        self.assertRaises(InvalidInterval, Interval.__sub__, m, s3)
-        self.assertRaises(InvalidInterval, Interval.__sub__, s3, m)
-        self.assertEqual(m - s1, Interval(LowerClosedLimit(10),
-                                          UpperOpenLimit(15)))
-        self.assertEqual(m - s2, Interval(LowerOpenLimit(15),
-                                          UpperClosedLimit(20)))
-        self.assertEqual(s2 - s1, Interval(LowerClosedLimit(10),
-                                           UpperOpenLimit(15)))
-        self.assertEqual(s1 - s2, Interval(LowerOpenLimit(15),
-                                           UpperClosedLimit(20)))
-        self.assertEqual(m - umo, Interval(LowerClosedLimit(10),
-                                           UpperClosedLimit(15)))
-        self.assertEqual(m - lmo, Interval(LowerClosedLimit(15),
-                                           UpperClosedLimit(20)))
-        self.assertEqual(m - uma, m)
-        self.assertEqual(m - lma, m)
-        self.assertEqual(m - uu, m)
-        self.assertEqual(m - lu, m)
-        self.assertRaises(TypeError, sub, m, lim)
-        self.assertRaises(TypeError, sub, lim, lu)
+        with self.assertRaises(InvalidInterval):
+            m - m
+        with self.assertRaises(InvalidInterval):
+            m - s3
+        with self.assertRaises(InvalidInterval):
+            s3 - m
+        for ival1, ival2, expected in (
+                (m, s1, Interval(LowerClosedLimit(10), UpperOpenLimit(15))),
+                (m, s2, Interval(LowerOpenLimit(15), UpperClosedLimit(20))),
+                (s2, s1, Interval(LowerClosedLimit(10), UpperOpenLimit(15))),
+                (s1, s2, Interval(LowerOpenLimit(15), UpperClosedLimit(20))),
+                (m, umo, Interval(LowerClosedLimit(10),
+                                  UpperClosedLimit(15))),
+                (m, lmo, Interval(LowerClosedLimit(15),
+                                  UpperClosedLimit(20))),
+                (m, uma, m),
+                (m, lma, m),
+                (m, uu, m),
+                (m, lu, m)):
+            with self.subTest(op='-', ival1=ival1, ival2=ival2):
+                self.assertEqual(ival1 - ival2, expected)
+        with self.assertRaises(TypeError):
+            m - lim
+        with self.assertRaises(TypeError):
+            lim - lu
         # test union
-        self.assertEqual(m | s1, m)
-        self.assertEqual(m | s2, m)
-        self.assertEqual(m | s3, m)
-        self.assertEqual(m | umo, Interval(LowerClosedLimit(10),
-                                           UpperOpenLimit(25)))
-        self.assertEqual(m | lmo, Interval(LowerOpenLimit(-5),
-                                           UpperClosedLimit(20)))
-        self.assertEqual(m | uma, Interval(LowerClosedLimit(10),
-                                           UpperOpenLimit(30)))
-        self.assertEqual(m | lma, Interval(LowerOpenLimit(-50),
-                                           UpperClosedLimit(20)))
-        self.assertRaises(InvalidInterval, Interval.__or__, m, uu)
-        self.assertRaises(InvalidInterval, Interval.__or__, m, lu)
-        self.assertRaises(TypeError, or_, m, lim)
-        self.assertRaises(TypeError, or_, lim, lu)
+        for ival, expected in (
+                (s1, m),
+                (s2, m),
+                (s3, m),
+                (umo, Interval(LowerClosedLimit(10), UpperOpenLimit(25))),
+                (lmo, Interval(LowerOpenLimit(-5), UpperClosedLimit(20))),
+                (uma, Interval(LowerClosedLimit(10), UpperOpenLimit(30))),
+                (lma, Interval(LowerOpenLimit(-50), UpperClosedLimit(20)))):
+            with self.subTest(op='|', ival=ival):
+                self.assertEqual(m | ival, expected)
+                self.assertEqual(ival | m, expected)
+        with self.assertRaises(InvalidInterval):
+            m | uu
+        with self.assertRaises(InvalidInterval):
+            m | lu
+        with self.assertRaises(TypeError):
+            m | lim
+        with self.assertRaises(TypeError):
+            lim | lu
         # test intersection
-        self.assertEqual(m & s1, s1)
-        self.assertEqual(m & s2, s2)
-        self.assertEqual(m & s3, s3)
-        self.assertEqual(m & umo, Interval(LowerOpenLimit(15),
-                                           UpperClosedLimit(20)))
-        self.assertEqual(m & lmo, Interval(LowerClosedLimit(10),
-                                           UpperOpenLimit(15)))
-        self.assertRaises(InvalidInterval, Interval.__and__, m, uma)
-        self.assertRaises(InvalidInterval, Interval.__and__, m, lma)
-        self.assertRaises(InvalidInterval, Interval.__and__, m, uu)
-        self.assertRaises(InvalidInterval, Interval.__and__, m, lu)
-        self.assertRaises(TypeError, and_, m, lim)
-        self.assertRaises(TypeError, and_, lim, lu)
+        for ival, expected in (
+                (s1, s1),
+                (s2, s2),
+                (s3, s3),
+                (umo, Interval(LowerOpenLimit(15), UpperClosedLimit(20))),
+                (lmo, Interval(LowerClosedLimit(10), UpperOpenLimit(15)))):
+            with self.subTest(op='&', ival=ival):
+                self.assertEqual(m & ival, expected)
+                self.assertEqual(ival & m, expected)
+        with self.assertRaises(InvalidInterval):
+            m & uma
+        with self.assertRaises(InvalidInterval):
+            m & lma
+        with self.assertRaises(InvalidInterval):
+            m & uu
+        with self.assertRaises(InvalidInterval):
+            m & lu
+        with self.assertRaises(TypeError):
+            m & lim
+        with self.assertRaises(TypeError):
+            lim & lu
 
     def test_repr(self):
         lower_limit = LowerClosedLimit(0)
         upper_limit = UpperClosedLimit(1)
-        # closed interval
-        ival = Interval(lower_limit, upper_limit)
-        self.assertEqual(ival, eval(repr(ival)))
-        # upper open interval
-        ival = Interval(lower_limit=lower_limit)
-        self.assertEqual(ival, eval(repr(ival)))
-        # lower open interval
-        ival = Interval(upper_limit=upper_limit)
-        self.assertEqual(ival, eval(repr(ival)))
-        # unbounded interval
-        ival = Interval()
-        self.assertEqual(ival, eval(repr(ival)))
+        # repr must only refer to the public classes
+        namespace = {'Interval': Interval, 'Limit': Limit}
+        for ival in (Interval(lower_limit, upper_limit),    # closed
+                     Interval(lower_limit=lower_limit),     # upper open
+                     Interval(upper_limit=upper_limit),     # lower open
+                     Interval()):                           # unbounded
+            r = repr(ival)
+            with self.subTest(repr=r):
+                self.assertEqual(ival, eval(r, namespace))
 
 
 if __name__ == '__main__':                              # pragma: no cover
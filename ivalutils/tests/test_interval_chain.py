@@ -14,78 +14,149 @@
 import unittest
 from copy import copy, deepcopy
 from datetime import date
-from operator import delitem, setitem
+from functools import total_ordering
+from itertools import chain, combinations, product
+from pickle import dumps, loads
+from weakref import ref
 from ivalutils.interval import (
-    IncompatibleLimits, Interval, LowerOpenInterval, LowerInfiniteLimit,
-    UpperInfiniteLimit, LowerClosedLimit, LowerOpenLimit, UpperClosedLimit,
-    UpperOpenLimit,
+    IncompatibleLimits, Interval, InvalidInterval, LowerClosedInterval,
+    LowerOpenInterval, LowerInfiniteLimit, UpperInfiniteLimit,
+    LowerClosedLimit, LowerOpenLimit, UpperClosedLimit, UpperOpenLimit,
 )
 from ivalutils.interval_chain import IntervalChain, EmptyIntervalChain
 
 
+@total_ordering
+class CountingValue:
+
+    """Value counting the comparisons made with it."""
+
+    n_comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        if not isinstance(other, CountingValue):
+            return NotImplemented
+        CountingValue.n_comparisons += 1
+        return self.value == other.value
+
+    def __lt__(self, other):
+        CountingValue.n_comparisons += 1
+        return self.value < other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+
 class IntervalChainTests(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # interval chains are immutable, so they can be shared among tests
+        cls.limits = (0, 10, 50, 300)
+        cls.ic = IntervalChain(cls.limits)
+
     def test_constructor(self):
-        limits = (0, 10, 50, 300)
+        limits = self.limits
         min_n_ivals = len(limits) - 1
-        for add_lower_inf in (True, False):
-            for add_upper_inf in (True, False):
+        for lower_closed, add_lower_inf, add_upper_inf in product(
+                (True, False), repeat=3):
+            with self.subTest(lower_closed=lower_closed,
+                              add_lower_inf=add_lower_inf,
+                              add_upper_inf=add_upper_inf):
                 n_ivals = min_n_ivals + (int(add_lower_inf) +
                                          int(add_upper_inf))
-                for lower_closed in (True, False):
-                    ic = IntervalChain(limits,
-                                       lower_closed=lower_closed,
-                                       add_lower_inf=add_lower_inf,
-                                       add_upper_inf=add_upper_inf)
-                    self.assertEqual(ic.limits, limits)
-                    self.assertEqual(len(ic), n_ivals)
-                    self.assertEqual(ic.is_lower_infinite(), add_lower_inf)
-                    self.assertEqual(ic.is_upper_infinite(), add_upper_inf)
-                    self.assertEqual(ic[1].lower_limit.is_closed(),
-                                     lower_closed)
-                    if add_lower_inf:
-                        lower_limit = LowerInfiniteLimit()
-                    elif lower_closed:
-                        lower_limit = LowerClosedLimit(limits[0])
-                    else:
-                        lower_limit = LowerOpenLimit(limits[0])
-                    if add_upper_inf:
-                        upper_limit = UpperInfiniteLimit()
-                    elif lower_closed:
-                        upper_limit = UpperOpenLimit(limits[-1])
-                    else:
-                        upper_limit = UpperClosedLimit(limits[-1])
-                    self.assertEqual(ic.total_interval,
-                                     Interval(lower_limit, upper_limit))
-                    ivals = ic._ivals
-                    for idx in range(len(ivals) - 1):
-                        self.assertTrue(ic[idx].is_adjacent(ic[idx + 1]))
+                ic = IntervalChain(limits,
+                                   lower_closed=lower_closed,
+                                   add_lower_inf=add_lower_inf,
+                                   add_upper_inf=add_upper_inf)
+                self.assertEqual(ic.limits, limits)
+                self.assertEqual(len(ic), n_ivals)
+                self.assertEqual(ic.is_lower_infinite(), add_lower_inf)
+                self.assertEqual(ic.is_upper_infinite(), add_upper_inf)
+                self.assertEqual(ic[1].lower_limit.is_closed(),
+                                 lower_closed)
+                if add_lower_inf:
+                    lower_limit = LowerInfiniteLimit()
+                elif lower_closed:
+                    lower_limit = LowerClosedLimit(limits[0])
+                else:
+                    lower_limit = LowerOpenLimit(limits[0])
+                if add_upper_inf:
+                    upper_limit = UpperInfiniteLimit()
+                elif lower_closed:
+                    upper_limit = UpperOpenLimit(limits[-1])
+                else:
+                    upper_limit = UpperClosedLimit(limits[-1])
+                self.assertEqual(ic.total_interval,
+                                 Interval(lower_limit, upper_limit))
+                self.assertIs(ic.total_interval, ic.total_interval)
+                for idx in range(len(ic) - 1):
+                    self.assertTrue(ic[idx].is_adjacent(ic[idx + 1]))
         # limits that do not define any interval:
-        self.assertRaises(EmptyIntervalChain, IntervalChain, ())
-        self.assertRaises(EmptyIntervalChain,
-                          IntervalChain, (3,), add_upper_inf=False)
+        with self.assertRaises(EmptyIntervalChain):
+            IntervalChain(())
+        with self.assertRaises(EmptyIntervalChain):
+            IntervalChain((3,), add_upper_inf=False)
         # incompatible limits
         limits = (0, 27, date.today())
-        self.assertRaises(IncompatibleLimits, IntervalChain, limits)
+        with self.assertRaises(IncompatibleLimits):
+            IntervalChain(limits)
+        # instances don't carry a __dict__, but can be weakly referenced
+        ic = IntervalChain((0, 10))
+        self.assertFalse(hasattr(ic, '__dict__'))
+        self.assertIs(ref(ic)(), ic)
+        # the intervals hold exactly the limits given, even if equal limits
+        # have been given to another chain before
+        for limits in ((0, 10.), (0., 10.), (-0., 10.)):
+            ic = IntervalChain(limits)
+            self.assertIs(ic[0].lower_limit.value, limits[0])
+            self.assertIs(ic[1].lower_limit.value, limits[1])
+        # intervals are created on first access, but not for mapping values
+        ic = IntervalChain((0, 20, 35))
+        self.assertFalse(hasattr(ic, '_ivals'))
+        self.assertEqual(ic.map2idx(27), 1)
+        self.assertEqual(ic, IntervalChain((0, 20, 35)))
+        self.assertFalse(hasattr(ic, '_ivals'))
+        self.assertEqual(ic[2], LowerClosedInterval(35))
+        self.assertTrue(hasattr(ic, '_ivals'))
+        # nevertheless, invalid limits are detected by the constructor
+        with self.assertRaises(InvalidInterval):
+            IntervalChain((0, 20, 20))
+        with self.assertRaises(InvalidInterval):
+            IntervalChain((0, 30, 20))
+        with self.assertRaises(TypeError):
+            IntervalChain((None,))
+        # limits need not be hashable
+        self.assertEqual(IntervalChain(([0], [10])).map2idx([5]), 0)
 
     def test_if_immutable(self):
         limits = [0, 10, 50, 300]
         ic = IntervalChain(limits)
-        self.assertRaises(TypeError, delitem, ic, 0)
-        self.assertRaises(TypeError, setitem, ic, 0, 5)
+        with self.assertRaises(TypeError):
+            del ic[0]
+        with self.assertRaises(TypeError):
+            ic[0] = 5
         self.assertEqual(ic.limits, tuple(limits))
         del limits[0]
         self.assertNotEqual(ic.limits, tuple(limits))
 
     def test_copy(self):
-        limits = (0, 10, 50, 300)
-        ic = IntervalChain(limits)
+        ic = self.ic
         self.assertIs(copy(ic), ic)
-        self.assertIsNot(deepcopy(ic), ic)
+        self.assertIs(deepcopy(ic), ic)
+        # chains can be pickled, also after their intervals have been built
+        ic = IntervalChain(self.limits)
+        str(ic)
+        unpickled = loads(dumps(ic))
+        self.assertEqual(unpickled, ic)
+        self.assertEqual(list(unpickled), list(ic))
 
     def test_sequence(self):
-        limits = [0, 10, 50, 300]
-        ic = IntervalChain(limits)
+        limits = self.limits
+        ic = self.ic
         self.assertEqual(len(ic), len(limits))
         for idx in range(len(ic)):
             self.assertEqual(ic[idx].lower_limit.value, limits[idx])
@@ -96,7 +167,8 @@ class IntervalChainTests(unittest.TestCase):
         for ival in ic:
             self.assertTrue(ival in ic)
             self.assertEqual(ic.count(ival), 1)
-        self.assertRaises(IndexError, ic.__getitem__, 6)
+        with self.assertRaises(IndexError):
+            ic[6]
         self.assertFalse(LowerOpenInterval(0) in ic)
         idx = len(limits)
         for ival in reversed(ic):
@@ -106,17 +178,29 @@ class IntervalChainTests(unittest.TestCase):
     def test_map2idx(self):
         # upper end infinite
         ic = IntervalChain(range(0, 1001, 5))
-        self.assertRaises(ValueError, ic.map2idx, -4)
+        with self.assertRaises(ValueError):
+            ic.map2idx(-4)
         self.assertEqual(ic.map2idx(2), 0)
         self.assertEqual(ic.map2idx(200), 40)
         self.assertEqual(ic.map2idx(2133), 200)
+        values = range(0, 1011)
+        expected = [min(value // 5, 200) for value in values]
+        self.assertEqual([ic.map2idx(value) for value in values], expected)
+        self.assertEqual(ic.map2idx_many(values), expected)
+        # same for limits not equidistant
+        ic = IntervalChain(tuple(range(0, 1001, 5)) + (1003,))
+        expected = [min(value // 5, 200) + (value >= 1003)
+                    for value in values]
+        self.assertEqual([ic.map2idx(value) for value in values], expected)
+        self.assertEqual(ic.map2idx_many(values), expected)
         # lower end infinite
         ic = IntervalChain(range(0, 1001, 5),
                            add_lower_inf=True, add_upper_inf=False)
         self.assertEqual(ic.map2idx(-4), 0)
         self.assertEqual(ic.map2idx(2), 1)
         self.assertEqual(ic.map2idx(200), 41)
-        self.assertRaises(ValueError, ic.map2idx, 1003)
+        with self.assertRaises(ValueError):
+            ic.map2idx(1003)
         # both ends infinite
         ic = IntervalChain(range(0, 1001, 5), add_lower_inf=True)
         self.assertEqual(ic.map2idx(-4), 0)
@@ -125,13 +209,89 @@ class IntervalChainTests(unittest.TestCase):
         self.assertEqual(ic.map2idx(2133), 201)
         # no end inifinite
         ic = IntervalChain(range(0, 1001, 5), add_upper_inf=False)
-        self.assertRaises(ValueError, ic.map2idx, -4)
+        with self.assertRaises(ValueError):
+            ic.map2idx(-4)
         self.assertEqual(ic.map2idx(328), 65)
-        self.assertRaises(ValueError, ic.map2idx, 1003)
+        with self.assertRaises(ValueError):
+            ic.map2idx(1003)
+        # lower open intervals
+        ic = IntervalChain((0, 10, 50), lower_closed=False)
+        with self.assertRaises(ValueError):
+            ic.map2idx(0)
+        self.assertEqual(ic.map2idx(10), 0)
+        self.assertEqual(ic.map2idx(11), 1)
+        self.assertEqual(ic.map2idx(50), 1)
+        self.assertEqual(ic.map2idx(73), 2)
+        ic = IntervalChain((0, 10, 50), lower_closed=False,
+                           add_lower_inf=True, add_upper_inf=False)
+        self.assertEqual(ic.map2idx(0), 0)
+        self.assertEqual(ic.map2idx(50), 2)
+        with self.assertRaises(ValueError):
+            ic.map2idx(51)
+        # results correspond to the intervals' containment (for equidistant
+        # integer limits the index is calculated directly)
+        for limits in ((0, 10, 50), (-7, 3, 13, 23), (0, 10, 50.)):
+            for lower_closed, add_lower_inf, add_upper_inf in product(
+                    (True, False), repeat=3):
+                ic = IntervalChain(limits, lower_closed=lower_closed,
+                                   add_lower_inf=add_lower_inf,
+                                   add_upper_inf=add_upper_inf)
+                for value in chain(range(-10, 55), (-.5, 3.5, 13., 50.)):
+                    idxs = [idx for idx, ival in enumerate(ic)
+                            if value in ival]
+                    if idxs:
+                        self.assertEqual([ic.map2idx(value)], idxs)
+                    else:
+                        with self.assertRaises(ValueError):
+                            ic.map2idx(value)
+                # NaN is not contained in any interval
+                with self.assertRaises(ValueError):
+                    ic.map2idx(float('nan'))
+                with self.assertRaises(ValueError):
+                    ic.map2idx_many([5, float('nan')])
+
+    def test_map2idx_complexity(self):
+        # map2idx must not do more than a binary search (plus checking the
+        # neighbouring limits of the position found)
+        n = 2000
+        max_comparisons = n.bit_length() + 3
+        for lower_closed in (True, False):
+            ic = IntervalChain([CountingValue(i) for i in range(n)],
+                               lower_closed=lower_closed)
+            for value in (-1, 0, 1, n // 3, n - 2, n - 1, n + 5):
+                with self.subTest(lower_closed=lower_closed, value=value):
+                    CountingValue.n_comparisons = 0
+                    try:
+                        ic.map2idx(CountingValue(value))
+                    except ValueError:
+                        pass
+                    self.assertLessEqual(CountingValue.n_comparisons,
+                                         max_comparisons)
+            values = [CountingValue(i) for i in range(1, n, 7)]
+            CountingValue.n_comparisons = 0
+            ic.map2idx_many(values)
+            self.assertLessEqual(CountingValue.n_comparisons,
+                                 len(values) * max_comparisons)
+
+    def test_map2idx_many(self):
+        ic = IntervalChain(range(0, 1001, 5))
+        values = [2, 200, 0, 2133, 999]
+        self.assertEqual(ic.map2idx_many(values),
+                         [ic.map2idx(value) for value in values])
+        self.assertEqual(ic.map2idx_many(iter(values)),
+                         [ic.map2idx(value) for value in values])
+        self.assertEqual(ic.map2idx_many([]), [])
+        with self.assertRaises(ValueError):
+            ic.map2idx_many([2, -4, 200])
+        ic = IntervalChain(('a', 'k', 'p', 'z'), lower_closed=False,
+                           add_lower_inf=True, add_upper_inf=False)
+        self.assertEqual(ic.map2idx_many('akpzb'), [0, 1, 2, 3, 1])
+        with self.assertRaises(ValueError):
+            ic.map2idx_many(['k', 'zz'])
 
     def test_eq(self):
-        limits = (0, 10, 50, 300)
-        ic1 = IntervalChain(limits)
+        limits = self.limits
+        ic1 = self.ic
         self.assertEqual(ic1, ic1)
         ic2 = IntervalChain(limits)
         self.assertEqual(ic1, ic2)
@@ -142,29 +302,33 @@ class IntervalChainTests(unittest.TestCase):
         ic2 = IntervalChain(limits, add_upper_inf=False)
         self.assertNotEqual(ic1, ic2)
         self.assertNotEqual(ic1, limits)
+        # equal if and only if the intervals are equal
+        ic2 = IntervalChain([float(limit) for limit in limits])
+        self.assertEqual(ic1, ic2)
+        self.assertEqual(tuple(ic1), tuple(ic2))
+        ic2 = IntervalChain(limits[:-1])
+        self.assertNotEqual(ic1, ic2)
+        self.assertNotEqual(tuple(ic1), tuple(ic2))
+        for params1, params2 in combinations(product((True, False),
+                                                     repeat=3), 2):
+            ic1 = IntervalChain(limits[:2], *params1)
+            ic2 = IntervalChain(limits[:2], *params2)
+            self.assertEqual(ic1 == ic2, tuple(ic1) == tuple(ic2))
 
     def test_repr(self):
-        limits = (0, 10, 50, 300)
-        # lower_closed=True, add_lower_inf=False, add_upper_inf=True
-        ic = IntervalChain(limits)
-        r = repr(ic)
-        self.assertEqual(ic, eval(r))
-        # lower_closed=False, add_lower_inf=False, add_upper_inf=True
-        ic = IntervalChain(limits, lower_closed=False)
-        r = repr(ic)
-        self.assertEqual(ic, eval(r))
-        # lower_closed=True, add_lower_inf=True, add_upper_inf=True
-        ic = IntervalChain(limits, add_lower_inf=True)
-        r = repr(ic)
-        self.assertEqual(ic, eval(r))
-        # lower_closed=True, add_lower_inf=True, add_upper_inf=False
-        ic = IntervalChain(limits, add_lower_inf=True, add_upper_inf=False)
-        r = repr(ic)
-        self.assertEqual(ic, eval(r))
-        # lower_closed=True, add_lower_inf=False, add_upper_inf=False
-        ic = IntervalChain(limits, add_lower_inf=False, add_upper_inf=False)
-        r = repr(ic)
-        self.assertEqual(ic, eval(r))
+        # repr must only refer to the public class
+        namespace = {'IntervalChain': IntervalChain}
+        for lower_closed, add_lower_inf, add_upper_inf in product(
+                (True, False), repeat=3):
+            ic = IntervalChain(self.limits, lower_closed=lower_closed,
+                               add_lower_inf=add_lower_inf,
+                               add_upper_inf=add_upper_inf)
+            r = repr(ic)
+            with self.subTest(repr=r):
+                self.assertEqual(ic, eval(r, namespace))
+                # repr and str are built only once
+                self.assertIs(repr(ic), r)
+                self.assertIs(str(ic), str(ic))
 
 
 if __name__ == '__main__':                              # pragma: no cover
@@ -14,7 +14,8 @@
 import unittest
 from copy import copy, deepcopy
 from datetime import date
-from operator import delitem, setitem
+from pickle import dumps, loads
+from weakref import ref
 from ivalutils.interval import (IncompatibleLimits, InvalidInterval,
                                 LowerOpenInterval)
 from ivalutils.interval_chain import IntervalChain
@@ -23,99 +24,152 @@ from ivalutils.interval_map import IntervalMapping
 
 class IntervalMappingTests(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # interval mappings are immutable, so they can be shared among tests
+        cls.limits = (0, 10, 50, 300)
+        cls.ic = IntervalChain(cls.limits)
+        cls.vals = ('alarming', 'low', 'medium', 'high')
+        cls.im = IntervalMapping(cls.ic, cls.vals)
+        cls.items = tuple(zip(cls.ic, cls.vals))
+
     def test_constructor(self):
-        limits = (0, 10, 50, 300)
-        ic = IntervalChain(limits)
-        vals = ('alarming', 'low', 'medium', 'high')
-        items = tuple(zip(ic, vals))
-        im = IntervalMapping(ic, vals)
-        self.assertIsInstance(im._keys, IntervalChain)
-        self.assertEqual(im._keys, ic)
-        self.assertEqual(im._vals, tuple(vals))
-        self.assertEqual(tuple(im.keys()), tuple(ic))
-        self.assertEqual(tuple(im.values()), tuple(vals))
-        self.assertEqual(tuple(im.items()), items)
-        # alternate arg
-        im = IntervalMapping(list(zip(limits, vals)))
-        self.assertIsInstance(im._keys, IntervalChain)
-        self.assertEqual(im._keys, ic)
-        self.assertEqual(im._vals, tuple(vals))
-        self.assertEqual(tuple(im.keys()), tuple(ic))
-        self.assertEqual(tuple(im.values()), tuple(vals))
-        self.assertEqual(tuple(im.items()), items)
+        limits, ic, vals, items = self.limits, self.ic, self.vals, self.items
         # non-infinite limits
-        limits = ('a', 'k', 'p', 'z')
-        ic = IntervalChain(limits, add_lower_inf=False, add_upper_inf=False)
-        vals = [1, 2, 3]
-        items = tuple(zip(ic, vals))
-        im = IntervalMapping(ic, vals)
-        self.assertIsInstance(im._keys, IntervalChain)
-        self.assertEqual(im._keys, ic)
-        self.assertEqual(im._vals, tuple(vals))
-        self.assertEqual(tuple(im.keys()), tuple(ic))
-        self.assertEqual(tuple(im.values()), tuple(vals))
-        self.assertEqual(tuple(im.items()), items)
-        # two tuples given
-        limits = (0, 10, 50, 300)
-        vals = ('alarming', 'low', 'medium', 'high')
-        im = IntervalMapping(limits, vals)
-        self.assertIsInstance(im._keys, IntervalChain)
-        self.assertEqual(tuple(im.keys()), tuple(IntervalChain(limits)))
-        self.assertEqual(tuple(im.values()), vals)
+        ic_ni = IntervalChain(('a', 'k', 'p', 'z'), add_lower_inf=False,
+                              add_upper_inf=False)
+        vals_ni = [1, 2, 3]
+        for form, im, keys, values, exp_items in (
+                ('chain + values', self.im, ic, vals, items),
+                ('2-tuples', IntervalMapping(list(zip(limits, vals))),
+                 ic, vals, items),
+                ('iterator of 2-tuples', IntervalMapping(zip(limits, vals)),
+                 ic, vals, items),
+                ('limits + values', IntervalMapping(limits, vals),
+                 ic, vals, items),
+                ('non-infinite chain + values',
+                 IntervalMapping(ic_ni, vals_ni), ic_ni, vals_ni,
+                 tuple(zip(ic_ni, vals_ni)))):
+            with self.subTest(form=form):
+                self.assertIsInstance(im._keys, IntervalChain)
+                self.assertEqual(im._keys, keys)
+                self.assertEqual(im._vals, tuple(values))
+                self.assertEqual(tuple(im.keys()), tuple(keys))
+                self.assertEqual(tuple(im.values()), tuple(values))
+                self.assertEqual(tuple(im.items()), exp_items)
+        # instances don't carry a __dict__, but can be weakly referenced
+        self.assertFalse(hasattr(self.im, '__dict__'))
+        self.assertIs(ref(self.im)(), self.im)
+
+    def test_constructor_wrong_args(self):
+        ic, vals = self.ic, self.vals
         # incompatible limits
         limits = (0, 27, date.today(), 90)
-        self.assertRaises(IncompatibleLimits, IntervalMapping, limits, vals)
-        self.assertRaises(IncompatibleLimits, IntervalMapping,
-                          list(zip(limits, vals)))
+        with self.assertRaises(IncompatibleLimits):
+            IntervalMapping(limits, vals)
+        with self.assertRaises(IncompatibleLimits):
+            IntervalMapping(list(zip(limits, vals)))
         # check wrong args
-        self.assertRaises(TypeError, IntervalMapping)
-        self.assertRaises(TypeError, IntervalMapping, 5)
-        self.assertRaises(TypeError, IntervalMapping, (5, 7, 20))
-        self.assertRaises(AssertionError, IntervalMapping, (5, 7), ('a',))
-        self.assertRaises(AssertionError, IntervalMapping, (), ())
-        self.assertRaises(TypeError, IntervalMapping, 'abc')
-        self.assertRaises(TypeError, IntervalMapping, ic)
-        self.assertRaises(TypeError, IntervalMapping, ic, vals, 'abc')
-        self.assertRaises(InvalidInterval, IntervalMapping,
-                          [(5, 'a'), (1, 'b')])
+        with self.assertRaises(TypeError):
+            IntervalMapping()
+        with self.assertRaises(TypeError):
+            IntervalMapping(5)
+        with self.assertRaises(TypeError):
+            IntervalMapping((5, 7, 20))
+        with self.assertRaises(AssertionError):
+            IntervalMapping((5, 7), ('a',))
+        with self.assertRaises(AssertionError):
+            IntervalMapping((), ())
+        with self.assertRaises(TypeError):
+            IntervalMapping('abc')
+        with self.assertRaises(TypeError):
+            IntervalMapping(ic)
+        with self.assertRaises(TypeError):
+            IntervalMapping(ic, vals, 'abc')
+        with self.assertRaises(TypeError):
+            IntervalMapping([(0, 'a'), (5,)])
+        with self.assertRaises(TypeError):
+            IntervalMapping([(0, 'a', 1), (5, 'b', 2)])
+        with self.assertRaises(TypeError):
+            IntervalMapping([(0, 'a', 1), (5, 'b')])
+        with self.assertRaises(TypeError):
+            IntervalMapping([(0, 'a'), (5, 'b', 2)])
+        with self.assertRaises(TypeError):
+            IntervalMapping(iter([(0, 'a', 1), (5, 'b')]))
+        with self.assertRaises(TypeError):
+            IntervalMapping([])
+        with self.assertRaises(InvalidInterval):
+            IntervalMapping([(5, 'a'), (1, 'b')])
 
     def test_if_immutable(self):
         limits = (0, 10, 50, 300)
         ic = IntervalChain(limits)
         vals = ['alarming', 'low', 'medium', 'high']
         im = IntervalMapping(ic, vals)
-        self.assertRaises(TypeError, delitem, im, ic[0])
-        self.assertRaises(TypeError, setitem, im, ic[0], 'x')
+        with self.assertRaises(TypeError):
+            del im[ic[0]]
+        with self.assertRaises(TypeError):
+            im[ic[0]] = 'x'
         self.assertEqual(im._vals, tuple(vals))
         del vals[0]
         self.assertNotEqual(im._vals, tuple(vals))
 
     def test_copy(self):
-        limits = (0, 10, 50, 300)
-        ic = IntervalChain(limits)
-        vals = ('a', 'b', 'c', 'd')
-        im = IntervalMapping(ic, vals)
+        im = self.im
         self.assertIs(copy(im), im)
         self.assertIsNot(deepcopy(im), im)
+        self.assertEqual(deepcopy(im), im)
+        self.assertIs(deepcopy(im)._keys, im._keys)
+        # mutable values are copied
+        vals = ([1], [2], [3], [4])
+        im = IntervalMapping(self.ic, vals)
+        im_copy = deepcopy(im)
+        self.assertEqual(im_copy, im)
+        self.assertIsNot(im_copy[self.ic[0]], im[self.ic[0]])
+        # values referring to the mapping refer to the copy afterwards
+        vals = ([], [], [], [])
+        im = IntervalMapping(self.ic, vals)
+        vals[0].append(im)
+        im_copy = deepcopy(im)
+        self.assertIs(im_copy[self.ic[0]][0], im_copy)
+        # mappings can be pickled, also after keys have been looked up
+        im = IntervalMapping(self.limits, self.vals)
+        im[self.ic[1]]
+        unpickled = loads(dumps(im))
+        self.assertEqual(unpickled, im)
+        self.assertEqual(list(unpickled.items()), list(im.items()))
+        # ... without the dict mapping intervals to indices (which depends on
+        # hash values that may differ between processes)
+        im._key2idx = {}
+        self.assertEqual(loads(dumps(im))[self.ic[1]], self.vals[1])
 
     def test_mapping(self):
-        limits = (0, 10, 50, 300)
-        ic = IntervalChain(limits)
-        vals = ['alarming', 'low', 'medium', 'high']
-        im = IntervalMapping(ic, vals)
+        ic, vals, im = self.ic, self.vals, self.im
         self.assertEqual(len(im), len(vals))
         for key in im:
             self.assertEqual(im[key], vals[ic.index(key)])
-        self.assertRaises(KeyError, im.__getitem__, LowerOpenInterval(0))
+        with self.assertRaises(KeyError):
+            im[LowerOpenInterval(0)]
         self.assertFalse(LowerOpenInterval(0) in im)
-        for ival in ic:
-            self.assertTrue(ival in im)
+        with self.assertRaises(KeyError):
+            im[0]
+        with self.assertRaises(KeyError):
+            im[[]]
+        self.assertFalse([] in im)
+        # equal intervals are found, regardless of the type of their limits
+        self.assertEqual(im[IntervalChain((0., 10., 50., 300.))[1]], 'low')
+        self.assertLessEqual(set(ic), im.keys())
+        # limits need not be hashable
+        ic = IntervalChain(([0], [10]))
+        im = IntervalMapping(ic, ('a', 'b'))
+        self.assertEqual(im[ic[1]], 'b')
+        self.assertTrue(ic[0] in im)
+        self.assertFalse(LowerOpenInterval([10]) in im)
+        self.assertEqual(list(im.values()), ['a', 'b'])
+        self.assertEqual(list(im.items()), list(zip(ic, ('a', 'b'))))
 
     def test_eq(self):
-        limits = (0, 10, 50, 300)
-        ic = IntervalChain(limits)
-        vals = ('alarming', 'low', 'medium', 'high')
-        im1 = IntervalMapping(ic, vals)
+        limits, ic, vals, im1 = self.limits, self.ic, self.vals, self.im
         self.assertEqual(im1, im1)
         im2 = IntervalMapping(ic, vals)
         self.assertEqual(im1, im2)
@@ -128,14 +182,14 @@ class IntervalMappingTests(unittest.TestCase):
         self.assertNotEqual(im2, d)
 
     def test_interval_mapping(self):
-        limits = (0, 10, 50, 300)
-        ic = IntervalChain(limits)
-        vals = ('alarming', 'low', 'medium', 'high')
-        im = IntervalMapping(ic, vals)
+        im = self.im
         self.assertEqual(im.map(5), 'alarming')
         self.assertEqual(im.map(10), 'low')
         self.assertEqual(im(500), 'high')
-        self.assertRaises(KeyError, im.map, -4)
+        with self.assertRaises(KeyError):
+            im.map(-4)
+        with self.assertRaises(KeyError):
+            im.map(float('nan'))
         limits = ('a', 'k', 'p', 'z')
         ic = IntervalChain(limits, add_lower_inf=False, add_upper_inf=False)
         vals = (1, 2, 3)
@@ -143,8 +197,26 @@ class IntervalMappingTests(unittest.TestCase):
         self.assertEqual(im.map('a'), 1)
         self.assertEqual(im.map('j'), 1)
         self.assertEqual(im('y'), 3)
-        self.assertRaises(KeyError, im.map, 'A')
-        self.assertRaises(KeyError, im, 'z')
+        with self.assertRaises(KeyError):
+            im.map('A')
+        with self.assertRaises(KeyError):
+            im('z')
+
+    def test_map_many(self):
+        im = self.im
+        values = [5, 10, 500, 0, 49]
+        self.assertEqual(im.map_many(values), [im(val) for val in values])
+        self.assertEqual(im.map_many(()), [])
+        with self.assertRaises(KeyError):
+            im.map_many([5, -4])
+        ic = IntervalChain(('a', 'k', 'p', 'z'), add_upper_inf=False)
+        im = IntervalMapping(ic, (1, 2, 3))
+        self.assertEqual(im.map_many('ajky'), [1, 1, 2, 3])
+        with self.assertRaises(KeyError):
+            im.map_many('az')
+        # values not contained in any interval mapped to default
+        self.assertEqual(im.map_many('Aajkyz', default=0), [0, 1, 1, 2, 3, 0])
+        self.assertEqual(im.map_many('az', default=None), [1, None])
 
 
 if __name__ == '__main__':                              # pragma: no cover